@@ -263,7 +263,7 @@ class LLMIntegrator:
             confidence = self._calculate_response_confidence(response_text, correct_answer, reasoning)
             
             # Clean up reasoning
-            reasoning = re.sub(r'\s+', ' ', reasoning).strip()
+            reasoning = ' '.join(reasoning.split())
             reasoning = reasoning[:500]  # Limit length
             
             return LLMResponse(
@@ -10,13 +10,17 @@ import json
 import logging
 import re
 import difflib
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
 import pdfplumber
 from datetime import datetime
 
-@dataclass
+# Shared (read-only) result for pages missing from the cache
+_EMPTY_PAGE_CONTENT: Dict[str, str] = {}
+
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a validation issue found during PDF comparison"""
     question_id: str
@@ -28,7 +32,7 @@ class ValidationIssue:
     page_number: int = 0
     confidence: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
     """Complete validation report"""
     total_questions: int = 0
@@ -56,6 +60,8 @@ class PDFValidator:
         
         self.validation_report = ValidationReport()
         self.pdf_cache = {}  # Cache extracted PDF content
+        self._flat_cache: Dict[Tuple[str, int], Dict[str, str]] = {}  # (source_file, page) -> page content
+        self._clean_cache: Dict[str, str] = {}  # Cleaned comparison text keyed by raw text
         
     def setup_logging(self):
         """Setup logging for validation"""
@@ -167,6 +173,7 @@ class PDFValidator:
                                 page_content[strategy_name] = text
                         
                         pdf_content[page_num] = page_content
+                        self._flat_cache[(pdf_file.name, page_num)] = page_content
                     
                     self.pdf_cache[pdf_file.name] = pdf_content
                     
@@ -200,10 +207,7 @@ class PDFValidator:
     
     def _get_page_content(self, source_file: str, page_number: int) -> Dict:
         """Get cached PDF content for specific page"""
-        if source_file not in self.pdf_cache:
-            return {}
-        
-        return self.pdf_cache[source_file].get(page_number, {})
+        return self._flat_cache.get((source_file, page_number), _EMPTY_PAGE_CONTENT)
     
     def _validate_question_text(self, question: Dict, pdf_content: Dict, question_id: str):
         """Validate question text accuracy against PDF"""
@@ -218,15 +222,15 @@ class PDFValidator:
         # Check against multiple extraction strategies
         best_match_score = 0
         best_strategy = None
+        clean_extracted = self._clean_text_for_comparison(extracted_description)
         
         for strategy_name, pdf_text in pdf_content.items():
             if pdf_text:
-                # Clean both texts for comparison
-                clean_extracted = self._clean_text_for_comparison(extracted_description)
+                # Clean PDF text for comparison (memoized, pages are shared by questions)
                 clean_pdf = self._clean_text_for_comparison(pdf_text)
                 
-                # Calculate similarity
-                similarity = self._calculate_text_similarity(clean_extracted, clean_pdf)
+                # Calculate similarity, skipping the exact ratio for strategies that cannot win
+                similarity = self._calculate_text_similarity(clean_extracted, clean_pdf, best_match_score)
                 
                 if similarity > best_match_score:
                     best_match_score = similarity
@@ -348,12 +352,19 @@ class PDFValidator:
                           "Case study information detected in PDF but not extracted")
     
     def _clean_text_for_comparison(self, text: str) -> str:
-        """Clean text for accurate comparison"""
+        """Clean text for accurate comparison, memoized per unique input"""
         if not text:
             return ""
         
+        cleaned = self._clean_cache.get(text)
+        if cleaned is None:
+            cleaned = self._clean_cache[text] = self._do_clean_text_for_comparison(text)
+        return cleaned
+    
+    def _do_clean_text_for_comparison(self, text: str) -> str:
+        """Clean text for accurate comparison"""
         # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', text.strip())
+        cleaned = ' '.join(text.split())
         
         # Remove common artifacts
         cleaned = re.sub(r'ExamTopics.*?Professional', '', cleaned, flags=re.IGNORECASE)
@@ -376,13 +387,24 @@ class PDFValidator:
         
         return cleaned.strip()
     
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two texts"""
-        if not text1 or not text2:
+    def _calculate_text_similarity(self, text1: str, text2: str, minimum: float = 0.0) -> float:
+        """Calculate similarity between two texts
+
+        Compares word token lists rather than raw characters, which keeps
+        SequenceMatcher close to linear on page-sized inputs. When the
+        quick_ratio() upper bound shows the texts cannot score above
+        minimum, the exact ratio is skipped and 0.0 is returned; any other
+        result is the exact ratio.
+        """
+        tokens1 = text1.lower().split() if text1 else []
+        tokens2 = text2.lower().split() if text2 else []
+        if not tokens1 or not tokens2:
             return 0.0
-        
+
         # Use difflib for sequence comparison
-        matcher = difflib.SequenceMatcher(None, text1.lower(), text2.lower())
+        matcher = difflib.SequenceMatcher(None, tokens1, tokens2, autojunk=True)
+        if minimum > 0.0 and matcher.quick_ratio() <= minimum:
+            return 0.0
         return matcher.ratio()
     
     def _add_issue(self, question_id: str, issue_type: str, severity: str, 
@@ -406,19 +428,26 @@ class PDFValidator:
         if self.validation_report.total_questions == 0:
             return
         
-        critical_issues = len(self.validation_report.get_critical_issues())
-        major_issues = len(self.validation_report.get_major_issues())
-        minor_issues = len([i for i in self.validation_report.issues if i.severity == 'minor'])
+        # Tally severities and issue types in a single pass over the issues
+        severity_counts = Counter()
+        type_counts = Counter()
+        for issue in self.validation_report.issues:
+            severity_counts[issue.severity] += 1
+            type_counts[issue.issue_type] += 1
+        
+        critical_issues = severity_counts['critical']
+        major_issues = severity_counts['major']
+        minor_issues = severity_counts['minor']
         
         # Calculate accuracy score (based on text similarity and OCR errors)
-        text_accuracy_issues = len([i for i in self.validation_report.issues if i.issue_type == 'text_accuracy'])
-        ocr_issues = len([i for i in self.validation_report.issues if i.issue_type == 'ocr_error'])
+        text_accuracy_issues = type_counts['text_accuracy']
+        ocr_issues = type_counts['ocr_error']
         
         self.validation_report.accuracy_score = max(0, 1 - (text_accuracy_issues + ocr_issues * 0.1) / self.validation_report.total_questions)
         
         # Calculate completeness score (based on missing content)
-        completeness_issues = len([i for i in self.validation_report.issues 
-                                 if i.issue_type in ['missing_text', 'missing_options', 'truncated_text']])
+        completeness_issues = (type_counts['missing_text'] + type_counts['missing_options'] +
+                               type_counts['truncated_text'])
         self.validation_report.completeness_score = max(0, 1 - completeness_issues / self.validation_report.total_questions)
         
         # Calculate overall quality score
@@ -434,19 +463,27 @@ class PDFValidator:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = output_dir / f"validation_report_{timestamp}.md"
         
-        report_content = self._generate_markdown_report()
+        report_parts = self._generate_markdown_report_parts()
         
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+            f.writelines(report_parts)
         
         self.logger.info(f"📊 Validation report generated: {output_file}")
         return str(output_file)
     
     def _generate_markdown_report(self) -> str:
         """Generate markdown content for validation report"""
+        return "".join(self._generate_markdown_report_parts())
+    
+    def _generate_markdown_report_parts(self) -> List[str]:
+        """Generate markdown content for validation report as a list of fragments"""
         report = self.validation_report
+        critical_issues = report.get_critical_issues()
+        major_issues = report.get_major_issues()
+        minor_count = sum(1 for i in report.issues if i.severity == 'minor')
         
-        content = f"""# PDF Validation Report
+        out = []
+        out.append(f"""# PDF Validation Report
 **Generated**: {report.timestamp}
 
 ## Summary
@@ -460,75 +497,73 @@ class PDFValidator:
 - **Overall Quality Score**: {report.quality_score:.2%}
 
 ### Issues Breakdown
-- **Critical Issues**: {len(report.get_critical_issues())} 🔴
-- **Major Issues**: {len(report.get_major_issues())} 🟡
-- **Minor Issues**: {len([i for i in report.issues if i.severity == 'minor'])} 🟢
+- **Critical Issues**: {len(critical_issues)} 🔴
+- **Major Issues**: {len(major_issues)} 🟡
+- **Minor Issues**: {minor_count} 🟢
 
 ---
 
 ## Critical Issues 🔴
 
-"""
+""")
         
-        critical_issues = report.get_critical_issues()
         if critical_issues:
             for issue in critical_issues:
-                content += f"""### {issue.question_id} - {issue.issue_type}
+                out.append(f"""### {issue.question_id} - {issue.issue_type}
 **Description**: {issue.description}
-"""
+""")
                 if issue.expected:
-                    content += f"**Expected**: {issue.expected[:200]}...\n"
+                    out.append(f"**Expected**: {issue.expected[:200]}...\n")
                 if issue.actual:
-                    content += f"**Actual**: {issue.actual[:200]}...\n"
-                content += "\n"
+                    out.append(f"**Actual**: {issue.actual[:200]}...\n")
+                out.append("\n")
         else:
-            content += "No critical issues found! ✅\n\n"
+            out.append("No critical issues found! ✅\n\n")
         
-        content += """---
+        out.append("""---
 
 ## Major Issues 🟡
 
-"""
+""")
         
-        major_issues = report.get_major_issues()
         if major_issues:
             for issue in major_issues:
-                content += f"""### {issue.question_id} - {issue.issue_type}
+                out.append(f"""### {issue.question_id} - {issue.issue_type}
 **Description**: {issue.description}
-"""
+""")
                 if issue.confidence:
-                    content += f"**Confidence**: {issue.confidence:.2%}\n"
-                content += "\n"
+                    out.append(f"**Confidence**: {issue.confidence:.2%}\n")
+                out.append("\n")
         else:
-            content += "No major issues found! ✅\n\n"
+            out.append("No major issues found! ✅\n\n")
         
-        content += """---
+        out.append("""---
 
 ## Recommendations
 
 Based on the validation results, here are the recommended actions:
 
-"""
+""")
         
         if report.quality_score < 0.7:
-            content += "🔥 **URGENT**: Quality score is below 70%. Immediate action required:\n"
-            content += "- Review and fix all critical issues\n"
-            content += "- Implement better OCR error correction\n"
-            content += "- Improve community comment separation\n\n"
+            out.append("🔥 **URGENT**: Quality score is below 70%. Immediate action required:\n")
+            out.append("- Review and fix all critical issues\n")
+            out.append("- Implement better OCR error correction\n")
+            out.append("- Improve community comment separation\n\n")
         
         if report.accuracy_score < 0.8:
-            content += "⚠️ **HIGH PRIORITY**: Accuracy issues detected:\n"
-            content += "- Review PDF extraction strategies\n"
-            content += "- Implement better text cleaning algorithms\n"
-            content += "- Validate question boundaries\n\n"
+            out.append("⚠️ **HIGH PRIORITY**: Accuracy issues detected:\n")
+            out.append("- Review PDF extraction strategies\n")
+            out.append("- Implement better text cleaning algorithms\n")
+            out.append("- Validate question boundaries\n\n")
         
         if report.completeness_score < 0.9:
-            content += "📝 **MEDIUM PRIORITY**: Completeness issues:\n"
-            content += "- Check for missing answer options\n"
-            content += "- Ensure all question text is captured\n"
-            content += "- Review case study information extraction\n\n"
+            out.append("📝 **MEDIUM PRIORITY**: Completeness issues:\n")
+            out.append("- Check for missing answer options\n")
+            out.append("- Ensure all question text is captured\n")
+            out.append("- Review case study information extraction\n\n")
         
-        content += """---
+        out.append("""---
 
 ## Next Steps
 
@@ -541,9 +576,9 @@ Based on the validation results, here are the recommended actions:
 ---
 
 *Report generated by GCP Exam Question Extractor Validation Tool*
-"""
+""")
         
-        return content
+        return out
 
 def main():
     """Main validation entry point"""
@@ -3,14 +3,286 @@ Question Parser Module for GCP Exam Question Extractor
 Handles question structure parsing, answer extraction, and community response analysis
 """
 
+import os
 import re
+import math
 import logging
-from typing import List, Dict, Optional, Tuple
+import functools
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 import json
 
-@dataclass
+try:
+    import ahocorasick  # Optional: linear-time multi-keyword scanning
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # Optional: linear-time matching for the community indicator scan
+except ImportError:
+    re2 = None
+
+# Precompiled patterns shared by all parser instances
+# Tried in priority order as separate searches: the first two start with a literal
+# that sre scans for quickly, which a fused alternation with the bare-digit form loses
+_RE_QUESTION_NUMBER_PATTERNS = [
+    re.compile(r'Question\s*#(\d+)', re.IGNORECASE),
+    re.compile(r'Question\s+(\d+)', re.IGNORECASE),
+    re.compile(r'(\d+)\.\s', re.IGNORECASE),
+]
+_RE_TOPIC = re.compile(r'topic\s+(\d+)')  # Applied to lowercased text
+_RE_TOPIC_HEADER = re.compile(r'^Topic\s+\d+', re.IGNORECASE)
+_RE_QUESTION_MARKER = re.compile(r'Question\s*#\s*\d+', re.IGNORECASE)
+_RE_HEADER_FOOTER = re.compile(r'ExamTopics|Profess.*onal|^\d+\s*$|Page \d+', re.IGNORECASE)
+_RE_OPTION_START = re.compile(r'^[A-F][\.\)]\s')
+_RE_USER_TIMESTAMP_LINE = re.compile(r'^\w+\s+\d+\s+(months?|weeks?|days?)\s+ago', re.IGNORECASE)
+_RE_INTRO_NOISE = re.compile(r'Question Set|Topic \d+')
+
+# Line tags produced by QuestionParser._classify_lines
+_LINE_COMMUNITY = 'community'
+_LINE_HEADER = 'header'
+_LINE_QUESTION_MARKER = 'question_marker'
+_LINE_TEXT = 'text'
+
+_RE_CASE_STUDY = re.compile("|".join([
+    r'\b\w+\s+is\s+a\s+(web-based\s+)?(company|organization|platform)',
+    r'For\s+this\s+question,\s+refer\s+to\s+the\s+\w+\s+case\s+study',
+    r'\w+\s+(provides|offers|operates|runs)',
+    r'case\s+study',
+    r'scenario',
+    r'company\s+background',
+]), re.IGNORECASE)
+
+# OCR error fixes. Literal fixes are applied in a single pass through one alternation;
+# longer sources come first so e.g. 'ReconKgure' wins over 'ConKgure'.
+def _compile_literal_fixes(fixes: Dict[str, str]):
+    """Compile literal OCR fixes into a case-insensitive pattern plus a lowercase lookup"""
+    sources = sorted(fixes, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(source) for source in sources), re.IGNORECASE)
+    return pattern, {source.lower(): replacement for source, replacement in fixes.items()}
+
+
+def _apply_literal_fixes(text: str, compiled_fixes) -> str:
+    """Replace every literal OCR error in text in one scan"""
+    pattern, lookup = compiled_fixes
+    return pattern.sub(lambda match: lookup[match.group(0).lower()], text)
+
+
+_OPTION_OCR_LITERALS = {
+    'ConKgure': 'Configure',
+    'ReconKgure': 'Reconfigure',
+    'traOc': 'traffic',
+    'solu"on': 'solution',
+    'applica"on': 'application',
+    'ques"on': 'question',
+}
+_DESCRIPTION_OCR_LITERALS = {
+    **_OPTION_OCR_LITERALS,
+    'Profess"onal': 'Professional',
+    'computa"on': 'computation',
+    'authen"cation': 'authentication',
+    'informa"on': 'information',
+    'migra"on': 'migration',
+    'opera"ons': 'operations',
+    'Data^ow': 'Dataflow',
+    'Data"ow': 'Dataflow',
+    'modiKed': 'modified',
+    'deKne': 'define',
+    'Knd': 'find',
+    'KreVox': 'Firefox',
+}
+_OPTION_OCR_FIXES = _compile_literal_fixes(_OPTION_OCR_LITERALS)
+_DESCRIPTION_OCR_FIXES = _compile_literal_fixes(_DESCRIPTION_OCR_LITERALS)
+
+# The few fixes that need real regex features, fused and dispatched by group name
+_DESCRIPTION_OCR_REGEX_REPLACEMENTS = {
+    'flat_files': 'flat files',
+    'timestamp': '',  # Remove username timestamps
+}
+_RE_DESCRIPTION_OCR_REGEX = re.compile(
+    r'(?P<flat_files>\^at\s+Kles)|(?P<timestamp>ll\s+months?\s+ago)',
+    re.IGNORECASE
+)
+# Anchored at the start, so it runs last on the already-fixed text
+_RE_LEADING_USER_TIMESTAMP = re.compile(
+    r'^\s*\w+\s+\d+\s+(months?|weeks?|days?),?\s*\d*\s*(weeks?|days?)?\s+ago\s*', re.IGNORECASE
+)  # Clean user timestamps
+
+# Option lines anywhere in a block; [^\S\n] keeps whitespace matching within one line
+_RE_OPTION = re.compile(r'^[^\S\n]*([A-Fa-f])[\.\)][^\S\n]*(.+)$', re.MULTILINE)
+_RE_OPTION_NOISE = re.compile(r'(is the answer|upvoted|months ago|weeks ago|days ago|Selected Answer)', re.IGNORECASE)
+_RE_PATH_CHARS = re.compile(r'[~/\\.]')
+
+# Single sweep over a question block for community votes: a vote trigger, a standalone
+# answer letter, a date, or a line break (used to limit how far an answer may follow).
+# Only the answer letter is case-sensitive, so the article "a" is not read as answer A.
+_RE_COMMUNITY_RESPONSE = re.compile(
+    r'(?P<vote>selected answer|correct answer|highly voted|most recent)'
+    r'|(?P<answer>(?-i:\b[A-F]\b))'
+    r'|(?P<date>\d{1,2}\s+(?:days?|weeks?|months?|years?)\s+ago|\d{1,2}/\d{1,2}/\d{2,4}|\d{4}-\d{2}-\d{2})'
+    r'|(?P<newline>\n)',
+    re.IGNORECASE
+)
+_VOTE_TRIGGER_FIELDS = {
+    'selected answer': 'community_answer',
+    'correct answer': 'community_answer',
+    'highly voted': 'highly_voted',
+    'most recent': 'most_recent',
+}
+
+# GCP services used to infer a topic, in priority order
+_GCP_SERVICES = [
+    'Compute Engine', 'Cloud Storage', 'BigQuery', 'Cloud SQL',
+    'Kubernetes', 'GKE', 'Cloud Functions', 'App Engine',
+    'Cloud Run', 'Dataflow', 'Pub/Sub', 'Firestore'
+]
+_GCP_SERVICES_LOWER = [(service.lower(), service) for service in _GCP_SERVICES]
+
+# Known community usernames (comment lines start with one of these)
+_KNOWN_USERNAMES = [
+    'Ahmed_Safwat', 'SAMBIT', 'kopper2019', 'ChinaSailor', 'AzureDP900', 'minmin2020', 'megumin',
+    'Mahmoud_E', 'holerina', 'BiddlyBdoyng', 'nagibator163', 'Ausias18', 'lynx256', 'practicioner',
+    'gcparchitect007', 'Kabiliravi', 'ry9280087', 'mlantonis', 'roastc', 'hems4all', 'AdityaGupta',
+    'zzaric', 'Rightsaidfred', 'bnlcnd', 'joe2211', 'PeppaPig', 'sjmsummer', 'vincy2202', 'AniketD',
+    'mifrah', 'JC0926', 'belly265',
+]
+_KNOWN_USERNAMES_LOWER = tuple(username.lower() for username in _KNOWN_USERNAMES)
+
+
+def _build_keyword_automaton(keywords: List[str]):
+    """Build an Aho-Corasick automaton mapping lowercased keywords to their list index"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(keywords):
+        automaton.add_word(keyword.lower(), index)
+    automaton.make_automaton()
+    return automaton
+
+
+_GCP_SERVICES_AUTOMATON = _build_keyword_automaton(_GCP_SERVICES)
+
+# Community comment indicators (NEVER include in questions)
+# Based on debug analysis: Unicode symbols \uf147 \uf007 precede usernames
+_COMMUNITY_INDICATOR_PATTERNS = [
+    # Unicode symbols (most reliable indicator from debug analysis)
+    r'\uf147\s*\uf007',  # Unicode symbols that start community comments
+
+    # Username + timestamp patterns
+    r'^(\s*)[A-Za-z][A-Za-z0-9_]{2,}\s+\d+\s+(years?|months?|weeks?|days?),?\s*(\d+\s+(months?|weeks?|days?))?\s+ago',
+
+    # Direct vote type indicators (enhanced)
+    r'(Selected Answer|Highly Voted|Most Recent|Community Answer):\s*',
+    r'Highly\s+Voted',  # Direct pattern
+    r'Most\s+Recent',   # Direct pattern
+
+    # Image/button indicators
+    r'^(\s*)[▶▼►◄⬅➡🔘□■📷🖼📸]',
+
+    # Known usernames pattern (expanded)
+    r'^(\s*)(' + '|'.join(_KNOWN_USERNAMES) + ')',
+
+    # URL patterns
+    r'https?://[^\s]+',
+
+    # Quote/comment style
+    r'^(\s*)[>|\\-]\s*',
+
+    # Upvoted patterns (enhanced)
+    r'upvoted\s+\d+\s+times?',
+    r'upvoted\s+\d+',  # Simple upvoted pattern
+
+    # Generic username patterns (more flexible)
+    r'^(\s*)[A-Za-z][A-Za-z0-9_]{2,}\s+(Highly\s+Voted|Most\s+Recent)\s+',
+    r'^(\s*)[A-Za-z][A-Za-z0-9_]{2,}\s+\d+\s+(years?|months?|weeks?|days?)\s+ago',
+]
+_COMMUNITY_INDICATORS = [re.compile(pattern, re.IGNORECASE) for pattern in _COMMUNITY_INDICATOR_PATTERNS]
+
+# Python's str-pattern \s and \d are Unicode-aware while RE2's are ASCII-only, so the
+# RE2 rewrite spells out the same sets (PDF text is full of NBSP and other Unicode spaces)
+_RE2_SPACE_SET = r'\s\x{0b}\x{1c}-\x{1f}\x{85}\pZ'
+_RE2_ESCAPES = {
+    's': ('[' + _RE2_SPACE_SET + ']', _RE2_SPACE_SET),
+    'd': (r'\p{Nd}', r'\p{Nd}'),
+}
+_RE2_NEGATED_ESCAPES = {
+    'S': '[^' + _RE2_SPACE_SET + ']',
+    'D': r'\P{Nd}',
+}
+
+
+def _to_re2_syntax(pattern: str) -> Optional[str]:
+    """
+    Rewrite a stdlib pattern for RE2 with the same Unicode semantics
+    
+    Returns None when the pattern uses an escape whose meaning differs between
+    the engines and has no rewrite here (\\w, \\b, or a negated class inside [...]).
+    """
+    parts = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            escape = pattern[index + 1]
+            if escape == 'u':
+                # RE2 spells code points as \x{...} instead of \u...
+                parts.append(r'\x{' + pattern[index + 2:index + 6] + '}')
+                index += 6
+                continue
+            if escape in _RE2_ESCAPES:
+                parts.append(_RE2_ESCAPES[escape][in_class])
+            elif escape in _RE2_NEGATED_ESCAPES and not in_class:
+                parts.append(_RE2_NEGATED_ESCAPES[escape])
+            elif escape in 'wWbBSD':
+                return None
+            else:
+                parts.append(pattern[index:index + 2])
+            index += 2
+            continue
+        if char == '[' and not in_class:
+            in_class = True
+        elif char == ']' and in_class:
+            in_class = False
+        parts.append(char)
+        index += 1
+    return ''.join(parts)
+
+
+def _compile_community_master(patterns: List[str], use_re2: bool = True):
+    """Fuse indicators into one case-insensitive pattern, compiled with RE2 when available"""
+    fused = "|".join(f"(?:{pattern})" for pattern in patterns)
+    if use_re2 and re2 is not None:
+        re2_pattern = _to_re2_syntax(fused)
+        if re2_pattern is not None:
+            try:
+                return re2.compile("(?i)" + re2_pattern)
+            except re2.error:
+                pass
+    return re.compile(fused, re.IGNORECASE)
+
+# All indicators fused into one alternation so each line is scanned once
+_COMMUNITY_MASTER_RE = _compile_community_master(_COMMUNITY_INDICATOR_PATTERNS)
+
+_RE_COMMENT_USERNAME = re.compile(r'^(\s*)([A-Za-z][A-Za-z0-9_]{2,})\s+(\d+\s+(?:years?|months?|weeks?|days?),?\s*(?:\d+\s+(?:months?|weeks?|days?))?\s+ago)')
+_RE_HIGHLY_VOTED = re.compile(r'highly voted', re.IGNORECASE)
+_RE_MOST_RECENT = re.compile(r'most recent', re.IGNORECASE)
+_RE_SELECTED_ANSWER = re.compile(r'selected answer', re.IGNORECASE)
+_RE_UPVOTED_COUNT = re.compile(r'upvoted\s+(\d+)\s+times?', re.IGNORECASE)
+
+# Confidence score tables, indexed by how many thresholds a question clears
+_VALID_ANSWERS = frozenset('ABCDEF')
+_DESCRIPTION_SCORES = (0.0, 0.2, 0.4)  # >= 20 chars, >= 50 chars
+_OPTION_SCORES = (0.0, 0.15, 0.3)  # >= 2 options, >= 4 options
+_ANSWER_SCORES = (0.0, 0.1, 0.2)  # 1 valid community answer, 2 or more
+_STRUCTURE_SCORES = (0.0, 0.05, 0.1)  # question number, topic
+
+@dataclass(slots=True)
 class CommunityComment:
     """Data structure for community comments"""
     question_id: str = ""
@@ -22,7 +294,7 @@ class CommunityComment:
     page_number: int = 0
     source: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     """Data structure for a parsed question"""
     unique_id: str = ""
@@ -44,27 +316,48 @@ class Question:
     introductory_info: str = ""  # Case study information
     has_claude_answer: bool = False  # Flag for filtering
 
+def _freeze_config(value):
+    """Recursively convert parsed JSON into read-only mappings and tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_config(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_config(item) for item in value)
+    return value
+
+
 class QuestionParser:
+    # Community patterns are compiled once at import time and shared by all instances
+    community_indicators = _COMMUNITY_INDICATORS
+    _community_master = _COMMUNITY_MASTER_RE
+    
     def __init__(self, config_path: str = None):
         self.logger = logging.getLogger(__name__)
+        self.config_path = config_path
         self.config = self._load_config(config_path)
         self.question_counter = 0
         self.community_comments = []  # Store extracted community comments
-        self.setup_community_patterns()
+        self._token_cache: Dict[str, frozenset] = {}  # Word sets keyed by text for similarity
         
-    def _load_config(self, config_path: str) -> Dict:
-        """Load configuration"""
+    def _load_config(self, config_path: str) -> Mapping:
+        """Load configuration (shared, read-only copy per config file)"""
         if config_path is None:
             config_path = "./project_config.json"
         
+        return self._load_config_cached(os.path.abspath(config_path))
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_config_cached(cls, config_path: str) -> Mapping:
+        """Read and freeze a config file once per process, keyed by absolute path"""
         try:
             with open(config_path, 'r') as f:
-                return json.load(f)
+                return _freeze_config(json.load(f))
         except FileNotFoundError:
-            self.logger.warning(f"Config file not found: {config_path}. Using defaults.")
-            return self._get_default_config()
+            logging.getLogger(__name__).warning(f"Config file not found: {config_path}. Using defaults.")
+            return _freeze_config(cls._get_default_config())
     
-    def _get_default_config(self) -> Dict:
+    @staticmethod
+    def _get_default_config() -> Dict:
         """Default configuration"""
         return {
             "question_parsing": {
@@ -72,47 +365,13 @@ class QuestionParser:
                 "option_patterns": ["^[A-F]\\.", "^[A-F]\\)", "^[A-F]\\s+"],
                 "community_answer_indicators": ["Selected Answer:", "Highly Voted", "Most Recent"],
                 "minimum_question_length": 50,
-                "maximum_options": 6
+                "maximum_options": 6,
+                "keep_raw_content": True,
+                "comment_flush_size": 500,
+                "parse_workers": 1
             }
         }
     
-    def setup_community_patterns(self):
-        """Setup patterns for community comment detection"""
-        # Community comment indicators (NEVER include in questions)
-        # Based on debug analysis: Unicode symbols \uf147 \uf007 precede usernames
-        self.community_indicators = [
-            # Unicode symbols (most reliable indicator from debug analysis)
-            r'\uf147\s*\uf007',  # Unicode symbols that start community comments
-            
-            # Username + timestamp patterns
-            r'^(\s*)[A-Za-z][A-Za-z0-9_]{2,}\s+\d+\s+(years?|months?|weeks?|days?),?\s*(\d+\s+(months?|weeks?|days?))?\s+ago',
-            
-            # Direct vote type indicators (enhanced)
-            r'(Selected Answer|Highly Voted|Most Recent|Community Answer):\s*',
-            r'Highly\s+Voted',  # Direct pattern
-            r'Most\s+Recent',   # Direct pattern
-            
-            # Image/button indicators
-            r'^(\s*)[▶▼►◄⬅➡🔘□■📷🖼📸]',
-            
-            # Known usernames pattern (expanded)
-            r'^(\s*)(Ahmed_Safwat|SAMBIT|kopper2019|ChinaSailor|AzureDP900|minmin2020|megumin|Mahmoud_E|holerina|BiddlyBdoyng|nagibator163|Ausias18|lynx256|practicioner|gcparchitect007|Kabiliravi|ry9280087|mlantonis|roastc|hems4all|AdityaGupta|zzaric|Rightsaidfred|bnlcnd|joe2211|PeppaPig|sjmsummer|vincy2202|AniketD|mifrah|JC0926|belly265)',
-            
-            # URL patterns
-            r'https?://[^\s]+',
-            
-            # Quote/comment style
-            r'^(\s*)[>|\\-]\s*',
-            
-            # Upvoted patterns (enhanced)
-            r'upvoted\s+\d+\s+times?',
-            r'upvoted\s+\d+',  # Simple upvoted pattern
-            
-            # Generic username patterns (more flexible)
-            r'^(\s*)[A-Za-z][A-Za-z0-9_]{2,}\s+(Highly\s+Voted|Most\s+Recent)\s+',
-            r'^(\s*)[A-Za-z][A-Za-z0-9_]{2,}\s+\d+\s+(years?|months?|weeks?|days?)\s+ago',
-        ]
-    
     def parse_question_structure(self, text_block: str, page_number: int, source_file: str, source_pdf_path: str = "") -> Optional[Question]:
         """
         Parse a text block into a structured Question object
@@ -144,11 +403,23 @@ class QuestionParser:
                 self.question_counter += 1
                 question.unique_id = f"Q{page_number}_{self.question_counter}"
             
+            # Lowercase once for all case-insensitive lookups
+            text_lower = text_block.lower()
+            
             # Extract topic
-            question.topic = self._extract_topic(text_block)
+            question.topic = self._extract_topic(text_block, text_lower)
+            
+            # Split and classify lines once, shared by the collectors below
+            tagged_lines = self._classify_lines(text_block)
+            # Only the description expands literal "\n"; comments split on real newlines,
+            # so a second pass is needed only when the block contains one
+            if '\\n' in text_block:
+                comment_lines = self._classify_lines(text_block, expand_literal_newlines=False)
+            else:
+                comment_lines = tagged_lines
             
             # Parse question description
-            question.description = self._extract_question_description(text_block)
+            question.description = self._extract_question_description(tagged_lines)
             
             # Parse answer options
             question.options = self._extract_answer_options(text_block)
@@ -161,8 +432,8 @@ class QuestionParser:
             question.latest_date = community_data.get('latest_date', '')
             
             # Extract and separate community comments
-            question_text, extracted_comments = self._separate_community_comments(
-                text_block, question.unique_id, page_number, source_file
+            extracted_comments = self._separate_community_comments(
+                comment_lines, question.unique_id, page_number, source_file
             )
             
             # Store community comments
@@ -183,77 +454,97 @@ class QuestionParser:
     
     def _extract_question_number(self, text: str) -> Optional[str]:
         """Extract question number from text"""
-        patterns = [
-            r'Question\s*#(\d+)',
-            r'Question\s+(\d+)',
-            r'(\d+)\.\s',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _RE_QUESTION_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         
         return None
     
-    def _extract_topic(self, text: str) -> str:
+    def _extract_topic(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract topic information from text"""
-        topic_match = re.search(r'Topic\s+(\d+)', text, re.IGNORECASE)
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        topic_match = _RE_TOPIC.search(text_lower)
         if topic_match:
             return f"Topic {topic_match.group(1)}"
         
         # Try to infer topic from content keywords
-        gcp_services = [
-            'Compute Engine', 'Cloud Storage', 'BigQuery', 'Cloud SQL',
-            'Kubernetes', 'GKE', 'Cloud Functions', 'App Engine',
-            'Cloud Run', 'Dataflow', 'Pub/Sub', 'Firestore'
-        ]
-        
-        for service in gcp_services:
-            if service.lower() in text.lower():
-                return service
+        if _GCP_SERVICES_AUTOMATON is not None:
+            # Single pass over the text; earliest service in list order wins
+            matched = [index for _, index in _GCP_SERVICES_AUTOMATON.iter(text_lower)]
+            if matched:
+                return _GCP_SERVICES[min(matched)]
+        else:
+            for service_lower, service in _GCP_SERVICES_LOWER:
+                if service_lower in text_lower:
+                    return service
         
         return "General"
     
-    def _extract_question_description(self, text: str) -> str:
-        """Extract the main question description including introductory context"""
+    def _classify_lines(self, text: str, expand_literal_newlines: bool = True) -> List[Tuple[str, str]]:
+        """
+        Split a text block into stripped, non-empty lines tagged by kind
+        
+        Each line is checked against the community/header/marker patterns exactly once,
+        so the description and comment collectors can share the result.
+        
+        Args:
+            text: Question block text
+            expand_literal_newlines: Also split on literal "\\n" sequences (description only)
+        
+        Returns:
+            List of (tag, line) tuples using the _LINE_* tags
+        """
         # Handle embedded newlines - convert literal \n to actual newlines first
         # Based on debug analysis: questions contain embedded \n characters
-        processed_text = text.replace('\\n', '\n')  # Convert literal \n to actual newlines
-        lines = processed_text.split('\n')
-        question_lines = []
-        intro_lines = []
-        in_question_section = False
-        found_question_marker = False
+        if expand_literal_newlines:
+            processed_text = text.replace('\\n', '\n')  # Convert literal \n to actual newlines
+        else:
+            processed_text = text
+        tagged_lines = []
         
-        for line in lines:
+        for line in processed_text.split('\n'):
             line = line.strip()
             if not line:
                 continue
             
-            # Skip community comments
-            if self._is_community_comment(line):
-                continue
-                
-            # Skip header/footer artifacts
-            if re.search(r'ExamTopics|Profess.*onal|^\d+\s*$|Page \d+', line, re.IGNORECASE):
+            # Lowercase the line itself: lowering the whole block first would turn a
+            # literal "\N" (e.g. C:\Network) into "\n" and split it into an extra line
+            if self._is_community_comment(line, line.lower()):
+                tag = _LINE_COMMUNITY
+            elif _RE_HEADER_FOOTER.search(line):
+                tag = _LINE_HEADER
+            elif _RE_QUESTION_MARKER.search(line):
+                tag = _LINE_QUESTION_MARKER
+            else:
+                tag = _LINE_TEXT
+            tagged_lines.append((tag, line))
+        
+        return tagged_lines
+    
+    def _extract_question_description(self, tagged_lines: List[Tuple[str, str]]) -> str:
+        """Extract the main question description including introductory context"""
+        question_lines = []
+        intro_lines = deque(maxlen=5)  # Only the last 5 lines before the question are used
+        found_question_marker = False
+        
+        for tag, line in tagged_lines:
+            # Skip community comments and header/footer artifacts
+            if tag == _LINE_COMMUNITY or tag == _LINE_HEADER:
                 continue
                 
             # Find the question marker
-            if re.search(r'Question\s*#\s*\d+', line, re.IGNORECASE):
+            if tag == _LINE_QUESTION_MARKER:
                 found_question_marker = True
-                in_question_section = True
                 continue
             
             # If we found question marker, start collecting
             if found_question_marker:
                 # Stop at answer options (A., B., C., etc.)
-                if re.match(r'^[A-F][\.\)]\s', line):
+                if _RE_OPTION_START.match(line):
                     break
-                
-                # Skip community comments that might have slipped through
-                if self._is_community_comment(line):
-                    continue
                     
                 question_lines.append(line)
             
@@ -261,121 +552,67 @@ class QuestionParser:
             elif not found_question_marker:
                 # Look for potential introductory content (case studies, company descriptions)
                 # Skip topic headers and user comments
-                if (not re.search(r'^Topic\s+\d+', line, re.IGNORECASE) and
-                    not re.search(r'^\w+\s+\d+\s+(months?|weeks?|days?)\s+ago', line, re.IGNORECASE) and
+                if (not _RE_TOPIC_HEADER.search(line) and
+                    not _RE_USER_TIMESTAMP_LINE.search(line) and
                     len(line) > 20):  # Only substantial content
                     
                     # Check if this looks like case study introduction
-                    case_study_indicators = [
-                        r'\b\w+\s+is\s+a\s+(web-based\s+)?(company|organization|platform)',
-                        r'For\s+this\s+question,\s+refer\s+to\s+the\s+\w+\s+case\s+study',
-                        r'\w+\s+(provides|offers|operates|runs)',
-                        r'case\s+study',
-                        r'scenario',
-                        r'company\s+background'
-                    ]
-                    
-                    is_case_study_content = any(re.search(pattern, line, re.IGNORECASE) for pattern in case_study_indicators)
+                    is_case_study_content = _RE_CASE_STUDY.search(line) is not None
                     
                     # Include if it's case study content or substantial context
                     if is_case_study_content or len(line) > 30:
                         intro_lines.append(line)
         
-        # Combine intro and question
-        all_content = []
-        
         # Add meaningful intro lines (like "Dress4Win is a web-based company...")
-        if intro_lines:
-            # Filter intro lines - keep substantial content
-            meaningful_intro = []
-            for intro_line in intro_lines[-5:]:  # Take last 5 lines before question
-                if len(intro_line) > 20 and not re.search(r'Question Set|Topic \d+', intro_line):
-                    meaningful_intro.append(intro_line)
-            all_content.extend(meaningful_intro)
-        
-        # Add question content
-        all_content.extend(question_lines)
-        
-        description = ' '.join(all_content).strip()
+        meaningful_intro = (line for line in intro_lines
+                            if len(line) > 20 and not _RE_INTRO_NOISE.search(line))
         
-        # Clean up common artifacts and OCR errors
-        description = re.sub(r'\s+', ' ', description)
+        # Combine intro and question, collapsing whitespace line by line
+        description = ' '.join(' '.join(line.split()) for line in chain(meaningful_intro, question_lines))
         
         # Fix common OCR errors
-        ocr_fixes = {
-            r'ConKgure': 'Configure',
-            r'ReconKgure': 'Reconfigure', 
-            r'traOc': 'traffic',
-            r'Profess"onal': 'Professional',
-            r'solu"on': 'solution',
-            r'applica"on': 'application',
-            r'ques"on': 'question',
-            r'computa"on': 'computation',
-            r'authen"cation': 'authentication',
-            r'informa"on': 'information',
-            r'migra"on': 'migration',
-            r'opera"ons': 'operations',
-            r'Data\^ow': 'Dataflow',
-            r'Data"ow': 'Dataflow',
-            r'\^at\s+Kles': 'flat files',
-            r'modiKed': 'modified',
-            r'deKne': 'define',
-            r'Knd': 'find',
-            r'KreVox': 'Firefox',
-            r'll\s+months?\s+ago': '',  # Remove username timestamps
-            r'^\s*\w+\s+\d+\s+(months?|weeks?|days?),?\s*\d*\s*(weeks?|days?)?\s+ago\s*': '',  # Clean user timestamps
-        }
-        
-        for pattern, replacement in ocr_fixes.items():
-            description = re.sub(pattern, replacement, description, flags=re.IGNORECASE)
+        description = _apply_literal_fixes(description, _DESCRIPTION_OCR_FIXES)
+        description = _RE_DESCRIPTION_OCR_REGEX.sub(
+            lambda match: _DESCRIPTION_OCR_REGEX_REPLACEMENTS[match.lastgroup], description
+        )
+        description = _RE_LEADING_USER_TIMESTAMP.sub('', description)
         
         return description
     
     def _extract_answer_options(self, text: str) -> Dict[str, str]:
         """Extract answer options (A, B, C, D, E, F)"""
         options = {}
-        lines = text.split('\n')
         
-        for line in lines:
-            line = line.strip()
-            if not line:
+        # Look for option patterns: A., B., C., D., etc. in one scan of the block
+        for match in _RE_OPTION.finditer(text):
+            option_letter = match.group(1).upper()
+            option_text = match.group(2).strip()
+            
+            # Skip if this looks like a user response or vote
+            if _RE_OPTION_NOISE.search(option_text):
                 continue
             
-            # Look for option patterns: A., B., C., D., etc.
-            match = re.match(r'^([A-F])[\.\)]\s*(.+)', line, re.IGNORECASE)
-            if match:
-                option_letter = match.group(1).upper()
-                option_text = match.group(2).strip()
-                
-                # Skip if this looks like a user response or vote
-                if re.search(r'(is the answer|upvoted|months ago|weeks ago|days ago|Selected Answer)', option_text, re.IGNORECASE):
-                    continue
-                
-                # Skip very short or clearly non-option text (but allow file paths like ~/bin)
-                if len(option_text) < 2 or (len(option_text) < 5 and not re.search(r'[~/\\.]', option_text)):
-                    continue
-                
-                # Clean up OCR errors in option text
-                ocr_fixes = {
-                    r'ConKgure': 'Configure',
-                    r'ReconKgure': 'Reconfigure', 
-                    r'traOc': 'traffic',
-                    r'solu"on': 'solution',
-                    r'applica"on': 'application',
-                    r'ques"on': 'question'
-                }
-                
-                for pattern, replacement in ocr_fixes.items():
-                    option_text = re.sub(pattern, replacement, option_text, flags=re.IGNORECASE)
-                
-                # Only add if we don't already have this option or if this one is longer/better
-                if option_letter not in options or len(option_text) > len(options[option_letter]):
-                    options[option_letter] = option_text
+            # Skip very short or clearly non-option text (but allow file paths like ~/bin)
+            if len(option_text) < 2 or (len(option_text) < 5 and not _RE_PATH_CHARS.search(option_text)):
+                continue
+            
+            # Clean up OCR errors in option text
+            option_text = _apply_literal_fixes(option_text, _OPTION_OCR_FIXES)
+            
+            # Only add if we don't already have this option or if this one is longer/better
+            if option_letter not in options or len(option_text) > len(options[option_letter]):
+                options[option_letter] = option_text
         
         return options
     
     def _parse_community_responses(self, text: str) -> Dict[str, str]:
-        """Parse community responses and voting information"""
+        """
+        Parse community responses and voting information
+        
+        Walks the text once: each vote trigger ('Selected Answer', 'Highly Voted', ...)
+        takes the first standalone answer letter on the same or the following line.
+        The last date seen becomes the latest date.
+        """
         community_data = {
             'community_answer': '',
             'highly_voted': '',
@@ -383,135 +620,92 @@ class QuestionParser:
             'latest_date': ''
         }
         
-        lines = text.split('\n')
-        
-        for i, line in enumerate(lines):
-            line = line.strip().lower()
-            
-            # Look for community answer indicators
-            if 'selected answer' in line or 'correct answer' in line:
-                # Try to find the answer in the same line or next line
-                answer_match = re.search(r'[A-F](?=\s|$|\.)', line.upper())
-                if answer_match:
-                    community_data['community_answer'] = answer_match.group()
-                elif i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    answer_match = re.search(r'^[A-F](?=\s|$|\.)', next_line.upper())
-                    if answer_match:
-                        community_data['community_answer'] = answer_match.group()
-            
-            elif 'highly voted' in line:
-                # Extract highly voted answer
-                answer_match = re.search(r'[A-F](?=\s|$|\.)', line.upper())
-                if answer_match:
-                    community_data['highly_voted'] = answer_match.group()
-                elif i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    answer_match = re.search(r'^[A-F](?=\s|$|\.)', next_line.upper())
-                    if answer_match:
-                        community_data['highly_voted'] = answer_match.group()
-            
-            elif 'most recent' in line:
-                # Extract most recent answer
-                answer_match = re.search(r'[A-F](?=\s|$|\.)', line.upper())
-                if answer_match:
-                    community_data['most_recent'] = answer_match.group()
-                elif i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    answer_match = re.search(r'^[A-F](?=\s|$|\.)', next_line.upper())
-                    if answer_match:
-                        community_data['most_recent'] = answer_match.group()
-            
-            # Look for dates
-            date_patterns = [
-                r'(\d{1,2}\s+(?:days?|weeks?|months?|years?)\s+ago)',
-                r'(\d{1,2}/\d{1,2}/\d{2,4})',
-                r'(\d{4}-\d{2}-\d{2})'
-            ]
-            
-            for pattern in date_patterns:
-                date_match = re.search(pattern, line)
-                if date_match:
-                    community_data['latest_date'] = date_match.group(1)
-                    break
+        pending_field = None  # Field waiting for an answer letter
+        line_breaks = 0  # Line breaks seen since the pending trigger
+        
+        for match in _RE_COMMUNITY_RESPONSE.finditer(text):
+            kind = match.lastgroup
+            if kind == 'newline':
+                if pending_field:
+                    line_breaks += 1
+                    if line_breaks > 1:
+                        pending_field = None
+            elif kind == 'vote':
+                pending_field = _VOTE_TRIGGER_FIELDS[match.group().lower()]
+                line_breaks = 0
+            elif kind == 'answer':
+                if pending_field:
+                    community_data[pending_field] = match.group()
+                    pending_field = None
+            else:
+                community_data['latest_date'] = match.group().lower()
         
         return community_data
     
     def _calculate_confidence(self, question: Question) -> float:
         """Calculate confidence score for the parsed question"""
-        score = 0.0
+        # Without options or a usable description there is no question to score
+        if len(question.options) < 2 and len(question.description) < 20:
+            return 0.0
+        
+        description_length = len(question.description)
+        option_count = len(question.options)
         
         # Question description quality (40% weight)
-        if question.description:
-            if len(question.description) >= 50:
-                score += 0.4
-            elif len(question.description) >= 20:
-                score += 0.2
+        score = _DESCRIPTION_SCORES[(description_length >= 20) + (description_length >= 50)]
         
         # Answer options completeness (30% weight)
-        if len(question.options) >= 4:
-            score += 0.3
-        elif len(question.options) >= 2:
-            score += 0.15
+        score += _OPTION_SCORES[(option_count >= 2) + (option_count >= 4)]
         
         # Community answer availability (20% weight)
-        community_answers = [
-            question.community_answer,
-            question.highly_voted_answer,
-            question.most_recent_answer
-        ]
-        valid_answers = [ans for ans in community_answers if ans and ans in 'ABCDEF']
-        if len(valid_answers) >= 2:
-            score += 0.2
-        elif len(valid_answers) >= 1:
-            score += 0.1
+        valid_answers = ((question.community_answer in _VALID_ANSWERS)
+                         + (question.highly_voted_answer in _VALID_ANSWERS)
+                         + (question.most_recent_answer in _VALID_ANSWERS))
+        score += _ANSWER_SCORES[min(valid_answers, 2)]
         
         # Structural consistency (10% weight)
-        if question.original_number and question.topic:
-            score += 0.1
-        elif question.original_number or question.topic:
-            score += 0.05
+        score += _STRUCTURE_SCORES[bool(question.original_number) + bool(question.topic)]
         
         return min(score, 1.0)
     
-    def _separate_community_comments(self, text: str, question_id: str, 
-                                   page_number: int, source_file: str) -> Tuple[str, List[CommunityComment]]:
-        """Separate community comments from question text"""
-        lines = text.split('\n')
-        clean_lines = []
+    def _separate_community_comments(self, tagged_lines: List[Tuple[str, str]], question_id: str, 
+                                   page_number: int, source_file: str) -> List[CommunityComment]:
+        """Collect community comments from the lines tagged as community content"""
         comments = []
         
-        for line in lines:
-            if self._is_community_comment(line):
+        for tag, line in tagged_lines:
+            if tag == _LINE_COMMUNITY:
                 # Extract community comment
                 comment = self._extract_community_comment(
                     line, question_id, page_number, source_file
                 )
                 if comment:
                     comments.append(comment)
-            else:
-                # Keep as part of question
-                clean_lines.append(line)
         
-        clean_text = '\n'.join(clean_lines)
-        return clean_text, comments
+        return comments
     
-    def _is_community_comment(self, line: str) -> bool:
-        """Check if line is a community comment"""
+    def _is_community_comment(self, line: str, line_lower: Optional[str] = None) -> bool:
+        """Check if line is a community comment (line_lower: already lowercased line, if known)"""
         line = line.strip()
         if not line:
             return False
         
         # First check for Unicode symbols (most reliable from debug analysis)
         if '\uf147' in line or '\uf007' in line:
-            self.logger.debug(f"Community comment detected (Unicode): {line[:50]}...")
+            self.logger.debug("Community comment detected (Unicode): %.50s...", line)
             return True
             
-        # Check other community indicators
-        for pattern in self.community_indicators:
-            if re.search(pattern, line, re.IGNORECASE):
-                self.logger.debug(f"Community comment detected: {line[:50]}...")
-                return True
+        # Known usernames are a plain prefix check, no regex needed
+        if line_lower is None:
+            line_lower = line.lower()
+        if line_lower.startswith(_KNOWN_USERNAMES_LOWER):
+            self.logger.debug("Community comment detected (username): %.50s...", line)
+            return True
+        
+        # Check other community indicators in a single scan
+        if self._community_master.search(line):
+            self.logger.debug("Community comment detected: %.50s...", line)
+            return True
         return False
     
     def _extract_community_comment(self, line: str, question_id: str, 
@@ -525,21 +719,21 @@ class QuestionParser:
             comment.content = line.strip()
             
             # Extract username and timestamp
-            username_match = re.search(r'^(\s*)([A-Za-z][A-Za-z0-9_]{2,})\s+(\d+\s+(?:years?|months?|weeks?|days?),?\s*(?:\d+\s+(?:months?|weeks?|days?))?\s+ago)', line)
+            username_match = _RE_COMMENT_USERNAME.search(line)
             if username_match:
                 comment.username = username_match.group(2)
                 comment.timestamp = username_match.group(3)
             
             # Extract vote type
-            if re.search(r'highly voted', line, re.IGNORECASE):
+            if _RE_HIGHLY_VOTED.search(line):
                 comment.vote_type = 'Highly Voted'
-            elif re.search(r'most recent', line, re.IGNORECASE):
+            elif _RE_MOST_RECENT.search(line):
                 comment.vote_type = 'Most Recent'
-            elif re.search(r'selected answer', line, re.IGNORECASE):
+            elif _RE_SELECTED_ANSWER.search(line):
                 comment.vote_type = 'Selected Answer'
             
             # Extract vote count
-            vote_match = re.search(r'upvoted\s+(\d+)\s+times?', line, re.IGNORECASE)
+            vote_match = _RE_UPVOTED_COUNT.search(line)
             if vote_match:
                 comment.vote_count = int(vote_match.group(1))
             
@@ -553,6 +747,84 @@ class QuestionParser:
         """Get all extracted community comments"""
         return self.community_comments
     
+    def iter_questions_from_pages(self, question_boundaries: Iterable[Dict],
+                                  comment_callback: Optional[Callable[[List[CommunityComment]], None]] = None) -> Iterator[Question]:
+        """
+        Lazily parse questions from identified question boundaries
+        
+        Args:
+            question_boundaries: Iterable of question boundary information
+            comment_callback: Optional sink receiving community comments in chunks
+                instead of keeping them all on the parser
+            
+        Yields:
+            Parsed Question objects above the confidence threshold
+        """
+        parsing_config = self.config["question_parsing"]
+        keep_raw = parsing_config.get("keep_raw_content", True)
+        flush_size = parsing_config.get("comment_flush_size", 500)
+        minimum_confidence = self.config.get("quality_control", {}).get("minimum_confidence_score", 0.3)  # Lower threshold for real data
+        
+        for start_page, question, error in self._parse_boundaries(question_boundaries):
+            if error is not None:
+                self.logger.error(f"Error parsing question from page {start_page}: {error}")
+                continue
+            
+            if comment_callback and len(self.community_comments) >= flush_size:
+                comment_callback(self.community_comments)
+                self.community_comments = []
+            
+            if question and question.confidence_score >= minimum_confidence:
+                if not keep_raw:
+                    question.raw_content = ""
+                self.logger.debug("Successfully parsed question: %s", question.unique_id)
+                yield question
+            else:
+                if question:
+                    self.logger.warning(f"Question {question.unique_id} below confidence threshold: {question.confidence_score}")
+                else:
+                    self.logger.warning(f"Failed to parse question from page {start_page}")
+        
+        if comment_callback and self.community_comments:
+            comment_callback(self.community_comments)
+            self.community_comments = []
+    
+    def _parse_boundary(self, boundary: Dict) -> Optional[Question]:
+        """Parse a single question boundary"""
+        # Use the full_content if available, otherwise reconstruct from content_lines
+        question_text = boundary.get('full_content', '\n'.join(boundary['content_lines']))
+        
+        return self.parse_question_structure(
+            question_text,
+            boundary['start_page'],
+            boundary['source_file']
+        )
+    
+    def _parse_boundaries(self, question_boundaries: Iterable[Dict]) -> Iterator[Tuple[int, Optional[Question], Optional[str]]]:
+        """Parse boundaries in order, in worker processes when parse_workers > 1"""
+        workers = self.config["question_parsing"].get("parse_workers", 1) or os.cpu_count() or 1
+        
+        if workers <= 1:
+            for boundary in question_boundaries:
+                try:
+                    yield boundary['start_page'], self._parse_boundary(boundary), None
+                except Exception as e:
+                    yield boundary.get('start_page'), None, str(e)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                                 initargs=(self.config_path,)) as executor:
+            results = executor.map(_parse_boundary_in_worker, question_boundaries, chunksize=8)
+            for start_page, question, comments, error in results:
+                if question and not question.original_number:
+                    # Worker counters are per process; number unnumbered questions here
+                    self.question_counter += 1
+                    question.unique_id = f"Q{question.page_number}_{self.question_counter}"
+                    for comment in comments:
+                        comment.question_id = question.unique_id
+                self.community_comments.extend(comments)
+                yield start_page, question, error
+    
     def parse_questions_from_pages(self, question_boundaries: List[Dict]) -> List[Question]:
         """
         Parse questions from identified question boundaries
@@ -563,31 +835,7 @@ class QuestionParser:
         Returns:
             List of parsed Question objects
         """
-        questions = []
-        
-        for boundary in question_boundaries:
-            try:
-                # Use the full_content if available, otherwise reconstruct from content_lines
-                question_text = boundary.get('full_content', '\n'.join(boundary['content_lines']))
-                
-                question = self.parse_question_structure(
-                    question_text,
-                    boundary['start_page'],
-                    boundary['source_file']
-                )
-                
-                if question and question.confidence_score >= self.config.get("quality_control", {}).get("minimum_confidence_score", 0.3):  # Lower threshold for real data
-                    questions.append(question)
-                    self.logger.debug(f"Successfully parsed question: {question.unique_id}")
-                else:
-                    if question:
-                        self.logger.warning(f"Question {question.unique_id} below confidence threshold: {question.confidence_score}")
-                    else:
-                        self.logger.warning(f"Failed to parse question from page {boundary['start_page']}")
-            
-            except Exception as e:
-                self.logger.error(f"Error parsing question from page {boundary['start_page']}: {str(e)}")
-                continue
+        questions = list(self.iter_questions_from_pages(question_boundaries))
         
         self.logger.info(f"Successfully parsed {len(questions)} questions from {len(question_boundaries)} boundaries")
         return questions
@@ -603,31 +851,94 @@ class QuestionParser:
             List of tuples (question1_id, question2_id, similarity_score)
         """
         duplicates = []
+        threshold = 0.8  # High similarity threshold
         
-        for i, q1 in enumerate(questions):
-            for j, q2 in enumerate(questions[i+1:], i+1):
-                similarity = self._calculate_similarity(q1.description, q2.description)
-                if similarity > 0.8:  # High similarity threshold
-                    duplicates.append((q1.unique_id, q2.unique_id, similarity))
+        # Only pairs that can possibly exceed the threshold are compared exactly
+        token_sets = [self._tokenize(q.description) for q in questions]
+        for i, j in sorted(self._duplicate_candidates(token_sets, threshold)):
+            q1, q2 = questions[i], questions[j]
+            similarity = self._jaccard(token_sets[i], token_sets[j])
+            if similarity > threshold:
+                duplicates.append((q1.unique_id, q2.unique_id, similarity))
         
         if duplicates:
             self.logger.info(f"Identified {len(duplicates)} potential duplicate pairs")
         
         return duplicates
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate text similarity between two strings"""
-        if not text1 or not text2:
-            return 0.0
+    @staticmethod
+    def _duplicate_candidates(token_sets: List[frozenset], threshold: float) -> set:
+        """
+        Find index pairs (i, j), i < j, whose word-set Jaccard similarity may reach threshold
         
-        # Simple word-based similarity
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        Uses prefix filtering: with tokens ordered by ascending document frequency, two sets
+        with Jaccard >= threshold must share a token within the first
+        len(s) - ceil(threshold * len(s)) + 1 tokens of each set. Rare tokens make the
+        prefixes short, so most unrelated pairs are never generated. Pairs whose set sizes
+        differ too much (smaller / larger < threshold) are dropped as well.
+        """
+        frequency = Counter(token for tokens in token_sets for token in tokens)
+        index = defaultdict(list)
+        candidates = set()
         
+        for i, tokens in enumerate(token_sets):
+            if not tokens:
+                continue
+            ordered = sorted(tokens, key=lambda token: (frequency[token], token))
+            # Small epsilon guards against float error rounding the required overlap up
+            prefix_length = len(ordered) - math.ceil(threshold * len(ordered) - 1e-9) + 1
+            size = len(ordered)
+            for token in ordered[:prefix_length]:
+                for j in index[token]:
+                    other_size = len(token_sets[j])
+                    if min(size, other_size) >= threshold * max(size, other_size) - 1e-9:
+                        candidates.add((j, i))
+                index[token].append(i)
+        
+        return candidates
+    
+    def _tokenize(self, text: str) -> frozenset:
+        """Get the lowercased word set for text, cached so each description is split once"""
+        if not text:
+            return frozenset()
+        
+        words = self._token_cache.get(text)
+        if words is None:
+            words = self._token_cache[text] = frozenset(text.lower().split())
+        return words
+    
+    @staticmethod
+    def _jaccard(words1: frozenset, words2: frozenset) -> float:
+        """Jaccard similarity of two word sets"""
         if not words1 or not words2:
             return 0.0
         
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
+        # Union size follows from the intersection, no union set is built
+        intersection = len(words1 & words2)
+        union = len(words1) + len(words2) - intersection
         
-        return intersection / union if union > 0 else 0.0
\ No newline at end of file
+        return intersection / union
+    
+    def _calculate_similarity(self, text1: str, text2: str) -> float:
+        """Calculate text similarity between two strings"""
+        # Simple word-based similarity
+        return self._jaccard(self._tokenize(text1), self._tokenize(text2))
+
+
+# Parser owned by each worker process of a parallel parse
+_WORKER_PARSER: Optional[QuestionParser] = None
+
+def _init_parse_worker(config_path: Optional[str]):
+    """Create the per-process parser once per worker"""
+    global _WORKER_PARSER
+    _WORKER_PARSER = QuestionParser(config_path)
+
+def _parse_boundary_in_worker(boundary: Dict) -> Tuple[int, Optional[Question], List[CommunityComment], Optional[str]]:
+    """Parse one boundary in a worker, returning its comments alongside the question"""
+    parser = _WORKER_PARSER
+    parser.community_comments = []
+    try:
+        question = parser._parse_boundary(boundary)
+    except Exception as e:
+        return boundary.get('start_page'), None, [], str(e)
+    return boundary['start_page'], question, parser.community_comments, None
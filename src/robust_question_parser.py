@@ -6,16 +6,145 @@ Completely rewritten with proper question boundary detection and community separ
 
 import sys
 import os
+import hashlib
 import json
 import logging
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass, field
+from typing import Iterator, List, Dict, Tuple, Optional
+from dataclasses import dataclass, field, fields
+from concurrent.futures import ProcessPoolExecutor
 import pdfplumber
 
-@dataclass
+# Precompiled patterns shared by all parser instances
+_RE_QUESTION_START_PATTERNS = [
+    re.compile(r'Question\s*#(\d+)\s+Topic\s+\d+', re.IGNORECASE),
+    re.compile(r'Question\s*#(\d+)', re.IGNORECASE),
+]
+_RE_CASE_STUDY_PATTERNS = [
+    re.compile(r'For this question, refer to the (.+) case study', re.IGNORECASE),
+    re.compile(r'(.+) is a (.+) company', re.IGNORECASE),
+    re.compile(r'Company Overview\s*-?\s*([^\n]+)', re.IGNORECASE),
+    re.compile(r'Solution Concept\s*-?\s*([^\n]+)', re.IGNORECASE),
+    re.compile(r'Business Requirements\s*-?\s*([^\n]+)', re.IGNORECASE),
+    re.compile(r'Technical Requirements\s*-?\s*([^\n]+)', re.IGNORECASE),
+    re.compile(r'Existing Technical Environment\s*-?\s*([^\n]+)', re.IGNORECASE),
+    re.compile(r'Executive Statement\s*-?\s*([^\n]+)', re.IGNORECASE),
+]
+# The first two take the rest of the line (up to a \uf147 marker) with greedy
+# classes, which match the same spans as a lazy scan with an end-of-line
+# lookahead without testing the lookahead at every character. They only differ
+# when the text after the letter starts with a newline or \uf147
+_RE_ANSWER_OPTION_PATTERNS = [
+    re.compile(r'([A-F])\.\s*([^\n\uf147]+)'),
+    re.compile(r'([A-F])\.\s*(.[^\n\uf147]*)', re.DOTALL),
+    re.compile(r'([A-F])\.\s*([^.\n]{5,200}?)(?=\n[A-F]\.|$|\uf147)', re.MULTILINE | re.DOTALL),
+]
+_RE_COMMUNITY_START_PATTERNS = [
+    re.compile(r'\uf147\s*\uf007', re.IGNORECASE),
+    re.compile(r'\b[A-Za-z][A-Za-z0-9_]{2,}\s+(Highly\s+Voted|Most\s+Recent)\s+', re.IGNORECASE),
+    re.compile(r'\b[A-Za-z][A-Za-z0-9_]{2,}\s+\d+\s+(years?|months?|weeks?|days?)\s+ago', re.IGNORECASE),
+    re.compile(r'upvoted\s+\d+\s+times?', re.IGNORECASE),
+    re.compile(r'Selected\s+Answer:', re.IGNORECASE),
+    re.compile(r'Highly\s+Voted', re.IGNORECASE),
+    re.compile(r'Most\s+Recent', re.IGNORECASE),
+]
+
+_RE_CASE_STUDY_REFERENCE = re.compile(r'For this question, refer to the (.+?) case study\.?\s*(.*)', re.DOTALL | re.IGNORECASE)
+_RE_COMMUNITY_SECTION_START = re.compile(r'(upvoted|\bHighly\s+Voted|\bMost\s+Recent|\b[A-Za-z][A-Za-z0-9_]{2,}\s+\d+\s+(years?|months?|weeks?|days?)\s+ago)', re.IGNORECASE)
+# Option letter and its content up to the next option marker (text is already on one line)
+_RE_OPTION_BLOCK = re.compile(r'([A-F])\.\s*(.*?)(?=[A-F]\.|\Z)', re.DOTALL)
+_RE_DESCRIPTION_BEFORE_OPTIONS = re.compile(r'^(.*?)(?=A\.)', re.DOTALL)
+_RE_QUESTION_DESCRIPTION = re.compile(r'Question\s*#?\d+[^\n]*\n(.*?)(?=\n[A-F]\.|$)', re.DOTALL)
+
+# Introductory info section patterns (enhanced for case studies), tried in order.
+# Each is paired with the literals it needs, in order, so patterns that can't
+# match are skipped without a regex scan (the Redis one is quadratic on a miss)
+_RE_INTRO_PATTERNS = [
+    (anchors, re.compile(pattern, re.IGNORECASE | re.DOTALL)) for anchors, pattern in (
+        (('introductory info',), r'Introductory Info\s*([\s\S]*?)(?=Question\s*#?\d+|$)'),
+        (('company overview',), r'Company Overview\s*-?\s*([\s\S]*?)(?=Solution Concept|Question|$)'),
+        (('for this question, refer to the dress4win case study',),
+         r'(For this question, refer to the Dress4Win case study[\s\S]*?)(?=Question\s*#?\d+|$)'),
+        (('dress4win',), r'(Dress4Win[\s\S]*?)(?=Question|$)'),
+        (('terramearth',), r'(TerramEarth[\s\S]*?)(?=Question|$)'),
+        (('mountkirk games',), r'(Mountkirk Games[\s\S]*?)(?=Question|$)'),
+        # Pattern for case studies that span multiple pages
+        (('redis', 'server cluster', 'capital expenditure'),
+         r'([\s\S]*?Redis.*?server cluster[\s\S]*?capital expenditure[\s\S]*?)(?=Question|$)'),
+    )
+]
+# IGNORECASE also equates i with dotless/dotted I, which casefold() keeps distinct
+_ANCHOR_FOLD_TABLE = str.maketrans({'\u0131': 'i', '\u0130': 'i'})
+_RE_PAGE_LABEL = re.compile(r'Page\s+\d+')
+_RE_EXAMTOPICS_LINE = re.compile(r'ExamTopics[^\n]*')
+
+_RE_HIGHLY_VOTED_ANSWER = re.compile(r'Highly\s+Voted[^A-F]*([A-F])', re.IGNORECASE)
+_RE_MOST_RECENT_ANSWER = re.compile(r'Most\s+Recent[^A-F]*([A-F])', re.IGNORECASE)
+_RE_SELECTED_ANSWER = re.compile(r'Selected\s+Answer:\s*([A-F])', re.IGNORECASE)
+
+# PDF artifacts removed in one translate pass: the private use area U+F000-U+F8FF
+# (icon glyphs such as \uf147 \uf007 \uf0c9) and block-drawing characters
+_ARTIFACT_TABLE = dict.fromkeys([*range(0xF000, 0xF900), 0x2588, 0x2590, 0x2591])
+
+def _collapse_ws(text: str) -> str:
+    """Collapse whitespace runs to single spaces and strip the ends"""
+    return ' '.join(text.split())
+
+def _contains_in_order(folded_text: str, anchors: Tuple[str, ...]) -> bool:
+    """Check that each anchor occurs in folded_text after the previous one"""
+    position = 0
+    for anchor in anchors:
+        position = folded_text.find(anchor, position)
+        if position < 0:
+            return False
+        position += len(anchor)
+    return True
+
+# Pages per worker task when extracting in parallel; bounds per-task memory
+_PAGE_BATCH_SIZE = 10
+
+# Default location of cached per-page layout text, reused when a PDF is re-processed
+_DEFAULT_PAGE_CACHE_DIR = Path('./.cache/pdf_pages')
+
+def _pdf_digest(pdf_path: str) -> str:
+    """Hash the PDF bytes so cached page text is invalidated when the file changes"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _extract_layout_text(page, page_num: int, cache_dir: Optional[Path], pdf_digest: Optional[str]) -> str:
+    """Return the page's layout text, reading and filling the on-disk cache when enabled"""
+    if cache_dir is None or pdf_digest is None:
+        return page.extract_text(layout=True) or ''
+    
+    cache_path = cache_dir / f"{pdf_digest}_{page_num}.txt"
+    try:
+        return cache_path.read_bytes().decode('utf-8', 'surrogatepass')
+    except (OSError, ValueError):
+        # Missing or undecodable entries are a cache miss and get rewritten below
+        pass
+    
+    raw_text = page.extract_text(layout=True) or ''
+    # Write to a per-process temp file and swap it in, so a killed process or two
+    # pool workers filling the same entry never leave a partial file behind
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(raw_text.encode('utf-8', 'surrogatepass'))
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # The cache is best effort; extraction still succeeds without it
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+    return raw_text
+
+@dataclass(slots=True)
 class CleanQuestion:
     """Data structure for a properly cleaned question"""
     id: str
@@ -37,7 +166,7 @@ class CleanQuestion:
     raw_pdf_text: str = ""
     raw_extracted_text: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class CommunityComment:
     """Separated community comment"""
     question_id: str
@@ -48,7 +177,14 @@ class CommunityComment:
     vote_type: str = ""
 
 class RobustQuestionParser:
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None,
+                 page_cache_dir: Optional[str] = str(_DEFAULT_PAGE_CACHE_DIR),
+                 keep_raw: bool = True):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Whether questions keep their first 1000 raw characters for debugging
+        self.keep_raw = keep_raw
+        # None disables the on-disk page text cache
+        self.page_cache_dir = Path(page_cache_dir) if page_cache_dir else None
         self.setup_logging()
         self.setup_patterns()
         self.questions = []
@@ -67,40 +203,16 @@ class RobustQuestionParser:
         """Setup robust patterns for parsing"""
         
         # Question start patterns (PRIMARY BOUNDARY DETECTION)
-        self.question_start_patterns = [
-            r'Question\s*#(\d+)\s+Topic\s+\d+',
-            r'Question\s*#(\d+)',
-        ]
+        self.question_start_patterns = _RE_QUESTION_START_PATTERNS
         
         # Case study patterns (enhanced for introductory info detection)
-        self.case_study_patterns = [
-            r'For this question, refer to the (.+) case study',
-            r'(.+) is a (.+) company',
-            r'Company Overview\s*-?\s*([^\n]+)',
-            r'Solution Concept\s*-?\s*([^\n]+)', 
-            r'Business Requirements\s*-?\s*([^\n]+)',
-            r'Technical Requirements\s*-?\s*([^\n]+)',
-            r'Existing Technical Environment\s*-?\s*([^\n]+)',
-            r'Executive Statement\s*-?\s*([^\n]+)',
-        ]
+        self.case_study_patterns = _RE_CASE_STUDY_PATTERNS
         
         # Answer option patterns
-        self.answer_option_patterns = [
-            r'([A-F])\.\s*([^\n\uf147]+?)(?=\n[A-F]\.|$|\uf147)',
-            r'([A-F])\.\s*(.+?)(?=\n[A-F]\.|$|\uf147)',
-            r'([A-F])\.\s*([^.\n]{5,200}?)(?=\n[A-F]\.|$|\uf147)',
-        ]
+        self.answer_option_patterns = _RE_ANSWER_OPTION_PATTERNS
         
         # Community comment start patterns
-        self.community_start_patterns = [
-            r'\uf147\s*\uf007',
-            r'\b[A-Za-z][A-Za-z0-9_]{2,}\s+(Highly\s+Voted|Most\s+Recent)\s+',
-            r'\b[A-Za-z][A-Za-z0-9_]{2,}\s+\d+\s+(years?|months?|weeks?|days?)\s+ago',
-            r'upvoted\s+\d+\s+times?',
-            r'Selected\s+Answer:',
-            r'Highly\s+Voted',
-            r'Most\s+Recent',
-        ]
+        self.community_start_patterns = _RE_COMMUNITY_START_PATTERNS
         
         # OCR correction patterns
         self.ocr_corrections = {
@@ -132,27 +244,17 @@ class RobustQuestionParser:
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 # First, try to extract as individual pages
-                all_pages_text = ""
-                for page_num, page in enumerate(pdf.pages, 1):
-                    self.logger.debug(f"  Processing page {page_num}")
-                    
-                    # Extract text with layout preservation
-                    raw_text = page.extract_text(layout=True)
-                    if not raw_text:
-                        continue
-                    
-                    # Accumulate all text for cross-page parsing
-                    all_pages_text += f"\n--- PAGE {page_num} ---\n" + raw_text
-                    
-                    # Find and extract questions from this page
-                    page_questions = self._extract_questions_from_page_text(
-                        raw_text, page_num, os.path.basename(pdf_path)
-                    )
+                page_chunks = []
+                for page_num, raw_text, page_questions in self._iter_page_results(pdf, pdf_path):
+                    # Keep page text for cross-page parsing; joined only if the fallback runs
+                    page_chunks.append(f"\n--- PAGE {page_num} ---\n{raw_text}")
                     questions.extend(page_questions)
                 
                 # If no questions found, try parsing entire PDF as one unit (for case studies)
-                if len(questions) == 0 and all_pages_text:
+                if len(questions) == 0 and page_chunks:
                     self.logger.info(f"  No questions found in individual pages, trying full PDF parsing...")
+                    all_pages_text = ''.join(page_chunks)
+                    del page_chunks
                     full_questions = self._extract_questions_from_full_pdf_text(
                         all_pages_text, os.path.basename(pdf_path)
                     )
@@ -164,6 +266,57 @@ class RobustQuestionParser:
         self.logger.info(f"✅ Extracted {len(questions)} clean questions from {os.path.basename(pdf_path)}")
         return questions
     
+    def _iter_page_results(self, pdf, pdf_path: str) -> Iterator[Tuple[int, str, List[CleanQuestion]]]:
+        """Yield (page number, layout text, questions) for each non-empty page, in page order"""
+        source_file = os.path.basename(pdf_path)
+        page_count = len(pdf.pages)
+        pdf_digest = _pdf_digest(pdf_path) if self.page_cache_dir else None
+        
+        if self.max_workers <= 1 or page_count <= _PAGE_BATCH_SIZE:
+            for page_num, page in enumerate(pdf.pages, 1):
+                self.logger.debug(f"  Processing page {page_num}")
+                
+                # Extract text with layout preservation
+                raw_text = _extract_layout_text(page, page_num, self.page_cache_dir, pdf_digest)
+                if not raw_text:
+                    continue
+                
+                # Find and extract questions from this page
+                yield page_num, raw_text, self._extract_questions_from_page_text(raw_text, page_num, source_file)
+            return
+        
+        # pdfplumber pages can't be pickled, so each worker reopens the file for its batch
+        batches = [range(start, min(start + _PAGE_BATCH_SIZE, page_count + 1))
+                   for start in range(1, page_count + 1, _PAGE_BATCH_SIZE)]
+        workers = min(self.max_workers, len(batches))
+        self.logger.debug(f"  Processing {page_count} pages in {len(batches)} batches across {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_page_worker,
+                                 initargs=(self.page_cache_dir, pdf_digest, self.keep_raw)) as executor:
+            for batch_results in executor.map(_extract_page_batch, [pdf_path] * len(batches), batches):
+                yield from batch_results
+    
+    def to_soa(self, questions: Optional[List[CleanQuestion]] = None) -> Dict[str, List]:
+        """
+        Convert questions to column lists (one list per field) for bulk processing
+        
+        Options are flattened to options_A .. options_F columns, with "" for
+        letters a question doesn't have.
+        """
+        if questions is None:
+            questions = self.questions
+        
+        columns = {f.name: [] for f in fields(CleanQuestion) if f.name != 'options'}
+        option_columns = {letter: [] for letter in 'ABCDEF'}
+        for question in questions:
+            for name, values in columns.items():
+                values.append(getattr(question, name))
+            for letter, values in option_columns.items():
+                values.append(question.options.get(letter, ""))
+        
+        for letter, values in option_columns.items():
+            columns[f'options_{letter}'] = values
+        return columns
+    
     def _extract_questions_from_full_pdf_text(self, full_text: str, source_file: str) -> List[CleanQuestion]:
         """Extract questions from full PDF text (for case studies spanning multiple pages)"""
         questions = []
@@ -175,7 +328,7 @@ class RobustQuestionParser:
         intro_info = self._extract_introductory_info(full_text)
         
         # Enhanced pattern for case study questions - capture everything after case study
-        case_study_match = re.search(r'For this question, refer to the (.+?) case study\.?\s*(.*)', full_text, re.DOTALL | re.IGNORECASE)
+        case_study_match = _RE_CASE_STUDY_REFERENCE.search(full_text)
         
         if case_study_match:
             case_study_name = case_study_match.group(1).strip()
@@ -184,7 +337,7 @@ class RobustQuestionParser:
             self.logger.info(f"  Found case study reference: {case_study_name}")
             
             # Find where the options end and community comments begin
-            community_start_match = re.search(r'(upvoted|\bHighly\s+Voted|\bMost\s+Recent|\b[A-Za-z][A-Za-z0-9_]{2,}\s+\d+\s+(years?|months?|weeks?|days?)\s+ago)', question_section, re.IGNORECASE)
+            community_start_match = _RE_COMMUNITY_SECTION_START.search(question_section)
             
             if community_start_match:
                 options_section = question_section[:community_start_match.start()].strip()
@@ -193,23 +346,16 @@ class RobustQuestionParser:
                 options_section = question_section
                 community_section = ""
             
-            # Split by option letters to extract options from clean section
-            parts = re.split(r'([A-F]\.)\s*', options_section)[1:]  # Skip first empty part
+            # Walk option letters in the clean section; community markers were cut off above
             option_matches = []
-            
-            # Group pairs (letter, content)
-            for i in range(0, len(parts) - 1, 2):
-                if i + 1 < len(parts):
-                    letter = parts[i].replace('.', '')  # Remove dot
-                    content = parts[i + 1].strip()
-                    # Clean any remaining artifacts from options
-                    content = re.sub(r'(upvoted|\bHighly\s+Voted|\bMost\s+Recent).*$', '', content, flags=re.IGNORECASE | re.DOTALL).strip()
-                    if content:  # Only add non-empty content
-                        option_matches.append((letter, content))
+            for match in _RE_OPTION_BLOCK.finditer(options_section):
+                content = match.group(2).strip()
+                if content:  # Only add non-empty content
+                    option_matches.append((match.group(1), content))
             
             if len(option_matches) >= 2:  # Must have at least 2 options
                 # Extract the question description (everything before option A)
-                desc_match = re.search(r'^(.*?)(?=A\.)', question_section, re.DOTALL)
+                desc_match = _RE_DESCRIPTION_BEFORE_OPTIONS.search(question_section)
                 if desc_match:
                     description = desc_match.group(1).strip()
                 else:
@@ -220,8 +366,7 @@ class RobustQuestionParser:
                 options = {}
                 for letter, text in option_matches:
                     # Clean up the option text
-                    cleaned_text = re.sub(r'\s+', ' ', text.strip())
-                    options[letter] = cleaned_text
+                    options[letter] = _collapse_ws(text)
                 
                 if len(description) > 10 and len(options) >= 2:
                     # Create the question
@@ -233,10 +378,11 @@ class RobustQuestionParser:
                         case_study_info=intro_info,
                         page_number=1,
                         source_file=source_file,
-                        confidence_score=0.85,
-                        raw_pdf_text=full_text[:1000],
-                        raw_extracted_text=options_section[:1000]
+                        confidence_score=0.85
                     )
+                    if self.keep_raw:
+                        question.raw_pdf_text = full_text[:1000]
+                        question.raw_extracted_text = options_section[:1000]
                     
                     # Extract community data from the separated community section
                     self._extract_community_answers_from_text(question, community_section)
@@ -250,21 +396,12 @@ class RobustQuestionParser:
         """Extract introductory information/case study from text"""
         intro_info = ""
         
-        # Introductory info section patterns (enhanced for case studies)
-        intro_patterns = [
-            r'Introductory Info\s*([\s\S]*?)(?=Question\s*#?\d+|$)',
-            r'Company Overview\s*-?\s*([\s\S]*?)(?=Solution Concept|Question|$)',
-            r'(For this question, refer to the Dress4Win case study[\s\S]*?)(?=Question\s*#?\d+|$)',
-            r'(Dress4Win[\s\S]*?)(?=Question|$)',
-            r'(TerramEarth[\s\S]*?)(?=Question|$)',
-            r'(Mountkirk Games[\s\S]*?)(?=Question|$)',
-            # Pattern for case studies that span multiple pages
-            r'([\s\S]*?Redis.*?server cluster[\s\S]*?capital expenditure[\s\S]*?)(?=Question|$)',
-        ]
-        
         # Look for introductory info patterns
-        for pattern in intro_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        folded_text = text.translate(_ANCHOR_FOLD_TABLE).casefold()
+        for anchors, pattern in _RE_INTRO_PATTERNS:
+            if not _contains_in_order(folded_text, anchors):
+                continue
+            match = pattern.search(text)
             if match:
                 intro_info = match.group(1).strip()
                 break
@@ -272,10 +409,10 @@ class RobustQuestionParser:
         # Clean up the extracted info
         if intro_info:
             # Remove excessive whitespace
-            intro_info = re.sub(r'\s+', ' ', intro_info)
+            intro_info = _collapse_ws(intro_info)
             # Remove common PDF artifacts
-            intro_info = re.sub(r'Page\s+\d+', '', intro_info)
-            intro_info = re.sub(r'ExamTopics[^\n]*', '', intro_info)
+            intro_info = _RE_PAGE_LABEL.sub('', intro_info)
+            intro_info = _RE_EXAMTOPICS_LINE.sub('', intro_info)
             intro_info = intro_info.strip()
             
         return intro_info[:2000]  # Limit to 2000 characters
@@ -287,9 +424,14 @@ class RobustQuestionParser:
         # Clean the text first
         text = self._clean_unicode_artifacts(text)
         
+        # A description needs a line break after its question header, so a
+        # page without one can't yield a question; skip the boundary scans
+        if '\n' not in text:
+            return questions
+        
         # Look for question patterns
         for pattern in self.question_start_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+            matches = list(pattern.finditer(text))
             
             for i, match in enumerate(matches):
                 question_start = match.start()
@@ -312,16 +454,20 @@ class RobustQuestionParser:
         """Parse a single question from text"""
         
         # Extract description (everything before first option)
-        desc_match = re.search(r'Question\s*#?\d+[^\n]*\n(.*?)(?=\n[A-F]\.|$)', question_text, re.DOTALL)
+        desc_match = _RE_QUESTION_DESCRIPTION.search(question_text)
         if not desc_match:
             return None
             
         description = desc_match.group(1).strip()
         
-        # Extract options
+        # Extract options. Without a \uf147 marker the first pattern finds the
+        # same letters as the second, which overwrites them, so it is skipped
         options = {}
-        for pattern in self.answer_option_patterns:
-            option_matches = re.finditer(pattern, question_text, re.MULTILINE | re.DOTALL)
+        option_patterns = self.answer_option_patterns
+        if '\uf147' not in question_text:
+            option_patterns = option_patterns[1:]
+        for pattern in option_patterns:
+            option_matches = pattern.finditer(question_text)
             for match in option_matches:
                 letter, text = match.groups()
                 if letter and text:
@@ -339,10 +485,10 @@ class RobustQuestionParser:
             options=options,
             page_number=page_num,
             source_file=source_file,
-            confidence_score=0.8,
-            raw_pdf_text=question_text[:1000],
-            raw_extracted_text=question_text[:1000]
+            confidence_score=0.8
         )
+        if self.keep_raw:
+            question.raw_pdf_text = question.raw_extracted_text = question_text[:1000]
         
         # Extract community answers
         community_section = question_text[desc_match.end():]
@@ -357,16 +503,16 @@ class RobustQuestionParser:
         question.all_community_comments = community_text.strip()
         
         # Look for answer patterns
-        highly_voted_match = re.search(r'Highly\s+Voted[^A-F]*([A-F])', community_text, re.IGNORECASE)
+        highly_voted_match = _RE_HIGHLY_VOTED_ANSWER.search(community_text)
         if highly_voted_match:
             question.highly_voted_answer = highly_voted_match.group(1)
         
-        most_recent_match = re.search(r'Most\s+Recent[^A-F]*([A-F])', community_text, re.IGNORECASE)
+        most_recent_match = _RE_MOST_RECENT_ANSWER.search(community_text)
         if most_recent_match:
             question.most_recent_answer = most_recent_match.group(1)
         
         # Generic community answer
-        answer_match = re.search(r'Selected\s+Answer:\s*([A-F])', community_text, re.IGNORECASE)
+        answer_match = _RE_SELECTED_ANSWER.search(community_text)
         if answer_match:
             question.community_answer = answer_match.group(1)
         elif question.highly_voted_answer:
@@ -379,17 +525,37 @@ class RobustQuestionParser:
         if not text:
             return text
         
-        # Remove specific problematic Unicode characters
-        text = text.replace('\uf147', '').replace('\uf007', '').replace('\uf0c9', '')
-        text = text.replace('\u2588', '').replace('\u2590', '').replace('\u2591', '')
-        
-        # Remove other Unicode symbols in private use areas
-        text = re.sub(r'[\uf000-\uf8ff]', '', text)
+        # Remove problematic Unicode characters and other private use area symbols
+        text = text.translate(_ARTIFACT_TABLE)
         
         # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        return _collapse_ws(text)
+
+# Parser owned by each worker process of a parallel extraction
+_WORKER_PARSER: Optional[RobustQuestionParser] = None
+
+_WORKER_PDF_DIGEST: Optional[str] = None
+
+def _init_page_worker(page_cache_dir: Optional[Path] = None, pdf_digest: Optional[str] = None,
+                      keep_raw: bool = True):
+    """Create the per-process parser once per worker"""
+    global _WORKER_PARSER, _WORKER_PDF_DIGEST
+    _WORKER_PARSER = RobustQuestionParser(max_workers=1, page_cache_dir=page_cache_dir, keep_raw=keep_raw)
+    _WORKER_PDF_DIGEST = pdf_digest
+
+def _extract_page_batch(pdf_path: str, page_numbers: range) -> List[Tuple[int, str, List[CleanQuestion]]]:
+    """Extract layout text and questions for a batch of pages in a worker process"""
+    source_file = os.path.basename(pdf_path)
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in page_numbers:
+            raw_text = _extract_layout_text(pdf.pages[page_num - 1], page_num,
+                                            _WORKER_PARSER.page_cache_dir, _WORKER_PDF_DIGEST)
+            if not raw_text:
+                continue
+            results.append((page_num, raw_text,
+                            _WORKER_PARSER._extract_questions_from_page_text(raw_text, page_num, source_file)))
+    return results
 
 def main():
     """Simple test function"""
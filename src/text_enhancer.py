@@ -5,14 +5,78 @@ Handles text cleaning, OCR error correction, and readability improvements
 
 import re
 import logging
+import functools
 from typing import Dict, List, Optional
 import json
 
+# Precompiled patterns shared by all enhancer instances
+_RE_HYPHENATED_BREAK = re.compile(r'(\w+)-\s*\n\s*(\w+)')
+_RE_SENTENCE_BREAK = re.compile(r'(\w[a-z])\s*\n\s*([a-z]\w)')
+_RE_LIST_ITEM_BREAK = re.compile(r'([A-F]\.)\s*\n\s*([A-Z])')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_EXTRA_NEWLINES = re.compile(r'\n\s*\n\s*\n+')
+_RE_BULLET = re.compile(r'^[\*\-\+]\s*', re.MULTILINE)
+_RE_QUESTION_HEADER = re.compile(r'question\s*#?\s*(\d+)', re.IGNORECASE)
+_RE_TOPIC_HEADER = re.compile(r'topic\s*(\d+)', re.IGNORECASE)
+_RE_OPTION_LETTER = re.compile(r'^([a-f])[\.\)]\s*', re.IGNORECASE | re.MULTILINE)
+_RE_CAPITALIZE_AFTER_PERIOD = re.compile(r'(\.\s+)([a-z])')
+_RE_ELLIPSIS = re.compile(r'[.]{3,}')
+_RE_REPEATED_EXCLAMATION = re.compile(r'[!]{2,}')
+_RE_REPEATED_QUESTION = re.compile(r'[?]{2,}')
+_RE_SPACE_BEFORE_PUNCTUATION = re.compile(r'\s+([.,;:!?])')
+_RE_SPACE_AFTER_PUNCTUATION = re.compile(r'([.,;:!?])\s+')
+_RE_QUESTION_PREFIX = re.compile(r'^(?:Question\s*#?\d+\.?\s*)', re.IGNORECASE)
+_RE_OPTION_PREFIX = re.compile(r'^[A-F][\.\)]\s*')
+_RE_DIGITS = re.compile(r'\d+')
+_RE_GROUP_REFERENCE = re.compile(r'\\(\d+)')
+# IGNORECASE also equates i with dotless/dotted I, which casefold() keeps distinct
+_TERM_FOLD_TABLE = str.maketrans({'\u0131': 'i', '\u0130': 'i'})
+
+def _upper_match(match) -> str:
+    """Substitution callback that upper-cases the whole match"""
+    return match.group(0).upper()
+
+def _compile_rule_group(rules: Dict[str, str], flags: int = 0):
+    """
+    Fuse substitution rules into one alternation applied in a single pass
+    
+    Only rules whose matches cannot feed or block each other belong in one group;
+    \\N references in replacements are renumbered to the fused group numbers.
+    
+    Returns:
+        Tuple of (compiled pattern, replacement by outer group number)
+    """
+    parts = []
+    replacements = {}
+    group = 0
+    for pattern, replacement in rules.items():
+        group += 1
+        parts.append(f'({pattern})')
+        if '\\' in replacement:
+            offset = group
+            replacement = _RE_GROUP_REFERENCE.sub(lambda m: f'\\g<{offset + int(m.group(1))}>', replacement)
+            replacements[group] = (True, replacement)
+        else:
+            replacements[group] = (False, replacement)
+        group += re.compile(pattern, flags).groups
+    return re.compile('|'.join(parts), flags), replacements
+
+def _apply_rule_group(text: str, compiled_group) -> str:
+    """Apply a rule group built by _compile_rule_group"""
+    pattern, replacements = compiled_group
+    
+    def _replace(match):
+        is_template, replacement = replacements[match.lastindex]
+        return match.expand(replacement) if is_template else replacement
+    
+    return pattern.sub(_replace, text)
+
 class TextEnhancer:
     def __init__(self, config_path: str = None):
         self.logger = logging.getLogger(__name__)
         self.config = self._load_config(config_path)
         self._init_correction_rules()
+        self._init_stages()
     
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration"""
@@ -40,16 +104,18 @@ class TextEnhancer:
     
     def _init_correction_rules(self):
         """Initialize text correction rules"""
-        # Common OCR errors and corrections
-        self.ocr_corrections = {
-            # Letter confusions
+        # Common OCR errors and corrections, in three groups applied in order
+        # Letter confusions
+        self.char_rules = {
             r'\b0(?=\w)': 'O',  # 0 -> O at word start
             r'\b1(?=\w)': 'l',  # 1 -> l at word start
             r'\b5(?=\w)': 'S',  # 5 -> S at word start
             r'(?<=\w)0\b': 'o',  # 0 -> o at word end
             r'(?<=\w)1\b': 'l',  # 1 -> l at word end
-            
-            # Common technical term fixes
+        }
+        
+        # Common technical term fixes
+        self.term_rules = {
             r'\bC1oud\b': 'Cloud',
             r'\bCompu te\b': 'Compute',
             r'\bB1gQuery\b': 'BigQuery',
@@ -58,13 +124,17 @@ class TextEnhancer:
             r'\bnetw0rk\b': 'network',
             r'\bser vice\b': 'service',
             r'\bapp1ication\b': 'application',
-            
-            # Spacing issues
+        }
+        
+        # Spacing issues
+        self.spacing_rules = {
             r'\s+(?=[.,;:])': '',  # Remove space before punctuation
             r'([.,;:])\s*(?=\w)': r'\1 ',  # Ensure space after punctuation
             r'(\w)\s*\n\s*(\w)': r'\1 \2',  # Fix broken words across lines
         }
         
+        self.ocr_corrections = {**self.char_rules, **self.term_rules, **self.spacing_rules}
+        
         # GCP-specific terms that should be preserved
         self.technical_terms = {
             'GCP', 'Google Cloud Platform', 'Compute Engine', 'Cloud Storage',
@@ -81,6 +151,46 @@ class TextEnhancer:
             r'(?<=\w)\s*,\s*and\s*': ', and ',  # Fix comma spacing in lists
             r'(?<=\w)\s*;\s*': '; ',  # Fix semicolon spacing
         }
+        
+        # Compile every rule once instead of on each call. Each group is one pass;
+        # groups stay separate where one group's output feeds the next
+        # (e.g. "5er vice" -> "Ser vice" -> "service").
+        # Only the term fixes contain letters, so only they need case folding
+        self._ocr_char_group = _compile_rule_group(self.char_rules)
+        self._ocr_term_group = _compile_rule_group(self.term_rules, re.IGNORECASE)
+        self._ocr_spacing_group = _compile_rule_group(self.spacing_rules)
+        # Every letter confusion rule needs one of these digits to match
+        self._ocr_trigger_chars = '015'
+        self._compiled_grammar = [(re.compile(pattern), replacement)
+                                  for pattern, replacement in self.grammar_fixes.items()]
+        self._technical_terms_lower = [(term.lower(), term) for term in self.technical_terms]
+        
+        # Casefolded key lets a plain substring check skip terms absent from the text
+        self._compiled_terms = [(term.casefold(), re.compile(re.escape(term), re.IGNORECASE), term)
+                                for term in self.technical_terms]
+    
+    def _init_stages(self):
+        """Resolve the enabled enhancement stages once from config"""
+        config = self.config.get("text_enhancement", {})
+        stages = (
+            ("handle_page_breaks", self._handle_page_breaks),
+            ("fix_ocr_errors", self._fix_ocr_errors),
+            ("standardize_formatting", self._standardize_formatting),
+            ("correct_grammar", self._apply_grammar_fixes),
+            ("preserve_technical_terms", self._preserve_technical_terms),
+        )
+        self._enabled_stages = tuple(stage for key, stage in stages if config.get(key, True))
+        
+        # Identical snippets (case-study boilerplate, repeated options) are enhanced once
+        self._enhance_cached = functools.lru_cache(maxsize=4096)(self._enhance_core)
+    
+    def _enhance_core(self, text: str) -> str:
+        """Run the enabled stages and final cleanup over non-empty text"""
+        for stage in self._enabled_stages:
+            text = stage(text)
+        
+        # Final cleanup
+        return self._final_cleanup(text)
     
     def enhance_extracted_text(self, raw_text: str) -> str:
         """
@@ -92,105 +202,107 @@ class TextEnhancer:
         Returns:
             Enhanced and cleaned text
         """
-        if not raw_text:
+        # Whitespace-only text always cleans up to nothing
+        if not raw_text or raw_text.isspace():
             return ""
         
-        enhanced_text = raw_text
-        
-        # Apply enhancements based on config
-        config = self.config.get("text_enhancement", {})
-        
-        if config.get("handle_page_breaks", True):
-            enhanced_text = self._handle_page_breaks(enhanced_text)
-        
-        if config.get("fix_ocr_errors", True):
-            enhanced_text = self._fix_ocr_errors(enhanced_text)
-        
-        if config.get("standardize_formatting", True):
-            enhanced_text = self._standardize_formatting(enhanced_text)
-        
-        if config.get("correct_grammar", True):
-            enhanced_text = self._apply_grammar_fixes(enhanced_text)
-        
-        if config.get("preserve_technical_terms", True):
-            enhanced_text = self._preserve_technical_terms(enhanced_text)
-        
-        # Final cleanup
-        enhanced_text = self._final_cleanup(enhanced_text)
+        return self._enhance_cached(raw_text)
+    
+    def enhance_batch(self, texts: List[str]) -> List[str]:
+        """
+        Enhance many texts, processing each distinct text once
         
-        return enhanced_text
+        Args:
+            texts: Raw texts, e.g. a column from RobustQuestionParser.to_soa()
+            
+        Returns:
+            Enhanced texts in input order
+        """
+        enhanced = {text: self.enhance_extracted_text(text) for text in dict.fromkeys(texts)}
+        return [enhanced[text] for text in texts]
     
     def _handle_page_breaks(self, text: str) -> str:
         """Handle text that spans across pages"""
         # Fix hyphenated words broken across lines
-        text = re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+        text = _RE_HYPHENATED_BREAK.sub(r'\1\2', text)
         
         # Fix sentences broken across lines (word ends with lowercase, next starts with lowercase)
-        text = re.sub(r'(\w[a-z])\s*\n\s*([a-z]\w)', r'\1 \2', text)
+        text = _RE_SENTENCE_BREAK.sub(r'\1 \2', text)
         
         # Fix list items broken across pages
-        text = re.sub(r'([A-F]\.)\s*\n\s*([A-Z])', r'\1 \2', text)
+        text = _RE_LIST_ITEM_BREAK.sub(r'\1 \2', text)
         
         return text
     
     def _fix_ocr_errors(self, text: str) -> str:
         """Fix common OCR errors"""
-        for pattern, replacement in self.ocr_corrections.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        if any(char in text for char in self._ocr_trigger_chars):
+            text = _apply_rule_group(text, self._ocr_char_group)
+        text = _apply_rule_group(text, self._ocr_term_group)
+        text = _apply_rule_group(text, self._ocr_spacing_group)
         
         return text
     
     def _standardize_formatting(self, text: str) -> str:
         """Standardize text formatting"""
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)  # Multiple spaces to single
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple newlines to double
+        text = _RE_WHITESPACE.sub(' ', text)  # Multiple spaces to single
+        if '\n' in text:
+            text = _RE_EXTRA_NEWLINES.sub('\n\n', text)  # Multiple newlines to double
         
         # Fix bullet points and list formatting
-        text = re.sub(r'^[\*\-\+]\s*', '• ', text, flags=re.MULTILINE)
+        if '*' in text or '-' in text or '+' in text:
+            text = _RE_BULLET.sub('• ', text)
         
-        # Standardize question/answer formatting
-        text = re.sub(r'(?i)question\s*#?\s*(\d+)', r'Question #\1', text)
-        text = re.sub(r'(?i)topic\s*(\d+)', r'Topic \1', text)
+        # Standardize question/answer formatting (substring checks skip absent headers)
+        folded = text.translate(_TERM_FOLD_TABLE).casefold()
+        if 'question' in folded:
+            text = _RE_QUESTION_HEADER.sub(r'Question #\1', text)
+        if 'topic' in folded:
+            text = _RE_TOPIC_HEADER.sub(r'Topic \1', text)
         
         # Fix option formatting (A., B., etc.)
-        for letter in 'ABCDEF':
-            text = re.sub(rf'(?i)^{letter.lower()}[\.\)]\s*', f'{letter}. ', text, flags=re.MULTILINE)
+        text = _RE_OPTION_LETTER.sub(lambda m: m.group(1).upper() + '. ', text)
         
         return text
     
     def _apply_grammar_fixes(self, text: str) -> str:
         """Apply basic grammar corrections"""
-        for pattern, replacement in self.grammar_fixes.items():
-            text = re.sub(pattern, replacement, text)
+        for pattern, replacement in self._compiled_grammar:
+            text = pattern.sub(replacement, text)
         
-        # Fix capitalization after periods
-        text = re.sub(r'(\.\s+)([a-z])', lambda m: m.group(1) + m.group(2).upper(), text)
+        # Fix capitalization after periods (upper() leaves the period and whitespace as they are)
+        if '.' in text:
+            text = _RE_CAPITALIZE_AFTER_PERIOD.sub(_upper_match, text)
         
         return text
     
     def _preserve_technical_terms(self, text: str) -> str:
         """Ensure technical terms are properly capitalized"""
-        for term in self.technical_terms:
-            # Create case-insensitive pattern
-            pattern = re.compile(re.escape(term), re.IGNORECASE)
-            text = pattern.sub(term, text)
+        folded = text.translate(_TERM_FOLD_TABLE).casefold()
+        for key, pattern, term in self._compiled_terms:
+            if key in folded:
+                text = pattern.sub(term, text)
         
         return text
     
     def _final_cleanup(self, text: str) -> str:
         """Final text cleanup"""
         # Remove excessive punctuation
-        text = re.sub(r'[.]{3,}', '...', text)
-        text = re.sub(r'[!]{2,}', '!', text)
-        text = re.sub(r'[?]{2,}', '?', text)
+        if '...' in text:
+            text = _RE_ELLIPSIS.sub('...', text)
+        if '!!' in text:
+            text = _RE_REPEATED_EXCLAMATION.sub('!', text)
+        if '??' in text:
+            text = _RE_REPEATED_QUESTION.sub('?', text)
         
         # Clean up spacing around punctuation
-        text = re.sub(r'\s+([.,;:!?])', r'\1', text)
-        text = re.sub(r'([.,;:!?])\s+', r'\1 ', text)
+        text = _RE_SPACE_BEFORE_PUNCTUATION.sub(r'\1', text)
+        text = _RE_SPACE_AFTER_PUNCTUATION.sub(r'\1 ', text)
         
-        # Remove trailing whitespace from lines
-        text = '\n'.join(line.rstrip() for line in text.split('\n'))
+        # Remove trailing whitespace from lines (single-line text is covered by strip below)
+        if '\n' in text:
+            text = '\n'.join(line.rstrip() for line in text.split('\n'))
         
         # Ensure text ends with proper punctuation if it's a sentence
         text = text.strip()
@@ -216,16 +328,14 @@ class TextEnhancer:
         enhanced = question_text
         
         # Remove question numbering if at the start
-        enhanced = re.sub(r'^(?:Question\s*#?\d+\.?\s*)', '', enhanced, flags=re.IGNORECASE).strip()
+        enhanced = _RE_QUESTION_PREFIX.sub('', enhanced).strip()
         
         # Ensure question ends with proper punctuation
         if enhanced and enhanced[-1] not in '?!.':
             enhanced += '?'
         
         # Apply general enhancement
-        enhanced = self.enhance_extracted_text(enhanced)
-        
-        return enhanced
+        return self.enhance_extracted_text(enhanced)
     
     def enhance_answer_option(self, option_text: str) -> str:
         """
@@ -243,16 +353,14 @@ class TextEnhancer:
         enhanced = option_text.strip()
         
         # Remove option letter if present at start
-        enhanced = re.sub(r'^[A-F][\.\)]\s*', '', enhanced).strip()
+        enhanced = _RE_OPTION_PREFIX.sub('', enhanced).strip()
         
         # Ensure first letter is capitalized
         if enhanced:
             enhanced = enhanced[0].upper() + enhanced[1:] if len(enhanced) > 1 else enhanced.upper()
         
         # Apply general enhancement
-        enhanced = self.enhance_extracted_text(enhanced)
-        
-        return enhanced
+        return self.enhance_extracted_text(enhanced)
     
     def detect_and_fix_encoding_issues(self, text: str) -> str:
         """
@@ -298,35 +406,34 @@ class TextEnhancer:
         Returns:
             Dictionary with validation results
         """
+        # Unchanged text can't have lost length, words or numbers
+        unchanged = original == enhanced
+        
         validation = {
             'valid': True,
             'issues': [],
             'length_change': len(enhanced) - len(original),
-            'word_count_change': len(enhanced.split()) - len(original.split())
+            'word_count_change': 0 if unchanged else len(enhanced.split()) - len(original.split())
         }
         
-        # Check for excessive length change (might indicate over-processing)
-        if abs(validation['length_change']) > len(original) * 0.3:
-            validation['valid'] = False
-            validation['issues'].append('Excessive length change detected')
-        
-        # Check if essential content is preserved (look for numbers, key terms)
-        original_numbers = set(re.findall(r'\d+', original))
-        enhanced_numbers = set(re.findall(r'\d+', enhanced))
-        
-        if original_numbers != enhanced_numbers:
-            validation['issues'].append('Numbers may have been altered')
-        
-        # Check for preserved technical terms
-        original_terms = set()
-        enhanced_terms = set()
-        for term in self.technical_terms:
-            if term.lower() in original.lower():
-                original_terms.add(term)
-            if term in enhanced:
-                enhanced_terms.add(term)
-        
-        if original_terms and not enhanced_terms:
+        if not unchanged:
+            # Check for excessive length change (might indicate over-processing)
+            if abs(validation['length_change']) > len(original) * 0.3:
+                validation['valid'] = False
+                validation['issues'].append('Excessive length change detected')
+            
+            # Check if essential content is preserved (look for numbers, key terms)
+            original_numbers = set(_RE_DIGITS.findall(original))
+            enhanced_numbers = set(_RE_DIGITS.findall(enhanced))
+            
+            if original_numbers != enhanced_numbers:
+                validation['issues'].append('Numbers may have been altered')
+        
+        # Check for preserved technical terms (still applies to unchanged text,
+        # since a lowercase term never counts as preserved)
+        original_lower = original.lower()
+        has_original_terms = any(term_lower in original_lower for term_lower, _ in self._technical_terms_lower)
+        if has_original_terms and not any(term in enhanced for _, term in self._technical_terms_lower):
             validation['issues'].append('Technical terms may have been lost')
         
         return validation
\ No newline at end of file
@@ -7,232 +7,236 @@ Creates side-by-side comparison between original PDF and extracted data
 import sys
 import os
 import json
+import hashlib
+import html
+import io
+import re
 from pathlib import Path
-from typing import List, Dict
+from collections import defaultdict
+from typing import List, Dict, Set, TextIO
+import shutil
 import pdfplumber
 from datetime import datetime
 
-def create_html_comparison(questions_data: Dict, pdf_dir: str = "./data/input") -> str:
-    """Create HTML comparison showing PDF vs extracted data"""
+try:
+    import fitz  # Optional: PyMuPDF extracts page text much faster than pdfplumber
+except ImportError:
+    fitz = None
+
+try:
+    from markupsafe import escape as _markup_escape  # Optional: C-accelerated HTML escaping
+except ImportError:
+    _markup_escape = None
+
+# Characters of PDF page text shown per question; longer pages are cut at extraction
+_PDF_TEXT_CHARS = 2000
+
+# Report stylesheet, copied next to generated reports
+_STYLESHEET = Path(__file__).resolve().parent.parent / "web_ui" / "static" / "comparison.css"
+
+# Description checks, each a single scan. re.ASCII keeps IGNORECASE to the same
+# letters str.lower() folds onto these terms
+_RE_COMMUNITY_TERMS = re.compile(r'upvoted|highly voted|most recent|ago', re.IGNORECASE | re.ASCII)
+_RE_COMMUNITY_ISSUE_TERMS = re.compile(r'upvoted|highly voted', re.IGNORECASE | re.ASCII)
+_RE_OCR_ERRORS = re.compile(r'ConKgure|ReconKgure|traOc|solu"on')
+_RE_OCR_ISSUE_ERRORS = re.compile(r'ConKgure|ReconKgure|traOc')
+
+def _escape(value) -> str:
+    """HTML-escape a value for embedding in the report"""
+    if _markup_escape is not None:
+        return str(_markup_escape(value))
+    return html.escape(str(value))
+
+def _load_pdf_pages(pdf_file: Path, page_numbers: Set[int]) -> Dict[int, str]:
+    """Extract the non-empty text of the requested pages, keyed by 1-based page number"""
+    pages = {}
+    if fitz is not None:
+        # MuPDF already returns text in reading order, so no layout pass is needed
+        with fitz.open(pdf_file) as doc:
+            for page_num in page_numbers:
+                if isinstance(page_num, int) and 1 <= page_num <= doc.page_count:
+                    text = doc.load_page(page_num - 1).get_text("text")
+                    if text:
+                        pages[page_num] = text
+        return pages
     
-    html_content = f"""<!DOCTYPE html>
+    with pdfplumber.open(pdf_file) as pdf:
+        for page_num in page_numbers:
+            if isinstance(page_num, int) and 1 <= page_num <= len(pdf.pages):
+                page = pdf.pages[page_num - 1]
+                text = page.extract_text(layout=True) or page.extract_text()
+                if text:
+                    pages[page_num] = text
+    return pages
+
+def _cached_page_text(pdf_file: Path, page_numbers: Set[int], cache_dir: Path) -> Dict[int, str]:
+    """
+    Return the requested pages' text, extracting only pages missing from the on-disk cache
+    
+    Only the first _PDF_TEXT_CHARS characters of each page are kept. The cache
+    file is keyed by a hash of the PDF bytes, the extraction backend and that
+    limit, so edited PDFs or a newly installed PyMuPDF never reuse stale text.
+    Pages without text are cached as "" so they aren't extracted again.
+    """
+    digest = hashlib.blake2b(pdf_file.read_bytes(), digest_size=16).hexdigest()
+    backend = 'fitz' if fitz is not None else 'pdfplumber'
+    cache_file = cache_dir / f"{digest}_{backend}_{_PDF_TEXT_CHARS}.json"
+    
+    cached = {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = {int(page_num): text for page_num, text in json.load(f).items()}
+    except (OSError, ValueError, AttributeError):
+        pass
+    
+    missing = {page_num for page_num in page_numbers
+               if isinstance(page_num, int) and page_num not in cached}
+    if missing:
+        extracted = _load_pdf_pages(pdf_file, missing)
+        for page_num in missing:
+            cached[page_num] = extracted.get(page_num, "")[:_PDF_TEXT_CHARS]
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(cached, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            print(f"Could not write PDF text cache for {pdf_file.name}: {e}")
+    
+    return {page_num: cached[page_num] for page_num in page_numbers
+            if page_num in cached and cached[page_num]}
+
+# Page skeleton up to the open navigation panel; styles live in the shared stylesheet
+_HTML_HEADER = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>PDF vs Extracted Data - Visual Comparison</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #4285f4, #34a853);
-            color: white;
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            text-align: center;
-        }}
-        
-        .comparison-container {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            margin-bottom: 30px;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .pdf-section, .extracted-section {{
-            padding: 20px;
-        }}
-        
-        .pdf-section {{
-            background: #fff3cd;
-            border-right: 2px solid #ffc107;
-        }}
-        
-        .extracted-section {{
-            background: #d1ecf1;
-        }}
-        
-        .section-title {{
-            font-size: 1.2rem;
-            font-weight: bold;
-            margin-bottom: 15px;
-            padding: 10px;
-            border-radius: 5px;
-        }}
-        
-        .pdf-title {{
-            background: #ffc107;
-            color: #212529;
-        }}
-        
-        .extracted-title {{
-            background: #17a2b8;
-            color: white;
-        }}
-        
-        .question-meta {{
-            font-size: 0.9rem;
-            color: #666;
-            margin-bottom: 10px;
-            padding: 5px 10px;
-            background: rgba(0,0,0,0.05);
-            border-radius: 5px;
-        }}
-        
-        .content {{
-            font-family: monospace;
-            font-size: 0.9rem;
-            line-height: 1.4;
-            white-space: pre-wrap;
-            border: 1px solid #ddd;
-            padding: 15px;
-            border-radius: 5px;
-            background: white;
-            max-height: 400px;
-            overflow-y: auto;
-        }}
-        
-        .issues-panel {{
-            background: #f8d7da;
-            border: 1px solid #f5c6cb;
-            border-radius: 5px;
-            padding: 15px;
-            margin-top: 15px;
-        }}
-        
-        .issue-critical {{
-            color: #721c24;
-            font-weight: bold;
-        }}
-        
-        .issue-major {{
-            color: #856404;
-        }}
-        
-        .issue-minor {{
-            color: #155724;
-        }}
-        
-        .navigation {{
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            background: white;
-            border-radius: 10px;
-            padding: 15px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            max-height: 70vh;
-            overflow-y: auto;
-            min-width: 200px;
-        }}
-        
-        .nav-item {{
-            display: block;
-            padding: 8px 12px;
-            text-decoration: none;
-            color: #333;
-            border-radius: 5px;
-            margin-bottom: 5px;
-            font-size: 0.9rem;
-        }}
-        
-        .nav-item:hover {{
-            background: #e9ecef;
-        }}
-        
-        .nav-item.critical {{
-            border-left: 4px solid #dc3545;
-        }}
-        
-        .nav-item.major {{
-            border-left: 4px solid #ffc107;
-        }}
-        
-        .nav-item.good {{
-            border-left: 4px solid #28a745;
-        }}
-        
-        @media (max-width: 768px) {{
-            .comparison-container {{
-                grid-template-columns: 1fr;
-            }}
-            
-            .navigation {{
-                position: relative;
-                width: 100%;
-                margin-bottom: 20px;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="comparison.css">
 </head>
 <body>
     <div class="header">
         <h1>📋 PDF vs Extracted Data - Visual Comparison</h1>
-        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p>Generated: {generated}</p>
     </div>
     
     <div class="navigation">
         <h3>📍 Navigation</h3>
 """
+
+# One question's side-by-side block, filled in with str.format
+_COMPARISON_BLOCK = """    <div class="comparison-container"{anchor}>
+        <div class="pdf-section">
+            <div class="section-title pdf-title">📄 Original PDF Content</div>
+            <div class="question-meta">Source: {source_file} | Page: {page_num}</div>
+            <div class="content">{pdf_text}</div>
+        </div>
+        
+        <div class="extracted-section">
+            <div class="section-title extracted-title">🔄 Extracted Data</div>
+            <div class="question-meta">Question ID: {question_id} | Confidence: {confidence:.1%}</div>
+            
+            <div style="margin-bottom: 15px;">
+                <strong>Question:</strong>
+                <div class="content" style="max-height: 200px;">{extracted_description}</div>
+            </div>
+            
+            <div>
+                <strong>Options:</strong>
+                <div class="content" style="max-height: 200px;">{options_text}</div>
+            </div>
+            
+            {issues_panel}
+        </div>
+    </div>
+    
+"""
+
+# Clean questions are collapsed to a one-line summary; the anchor moves to the
+# <details> element so navigation links still land on them
+_CLEAN_BLOCK_OPEN = """    <details class="clean-question" id="{question_id}">
+        <summary>{question_id} - Page {page_num} - ✅ Clean</summary>
+"""
+_CLEAN_BLOCK_CLOSE = """    </details>
+    
+"""
+
+# One line of the issues panel
+_ISSUE_LINE = '<div class="issue-{severity_class}">{severity}: {message}</div>'
+
+# Summary and closing tags
+_HTML_FOOTER = """    <div style="text-align: center; margin-top: 40px; padding: 20px; background: white; border-radius: 10px;">
+        <h3>📊 Summary</h3>
+        <p>This comparison shows the first 20 questions for detailed analysis.</p>
+        <p>Use the navigation panel to jump to specific questions.</p>
+        <p><strong>Color Coding:</strong> 🔴 Critical Issues | 🟡 Major Issues | 🟢 Good Quality</p>
+    </div>
+    
+</body>
+</html>"""
+
+def create_html_comparison(questions_data: Dict, pdf_dir: str = "./data/input",
+                           cache_dir: str = "./data/cache/pdf_text") -> str:
+    """Create HTML comparison showing PDF vs extracted data"""
+    buffer = io.StringIO()
+    write_html_comparison(questions_data, buffer, pdf_dir, cache_dir)
+    return buffer.getvalue()
+
+def write_html_comparison(questions_data: Dict, out: TextIO, pdf_dir: str = "./data/input",
+                          cache_dir: str = "./data/cache/pdf_text") -> None:
+    """Write the HTML comparison to out, one fragment at a time"""
+    out.write(_HTML_HEADER.format(generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+    
+    # Limit to first 20 for performance. Top-level keys win over metadata; the
+    # metadata dict is looked up once per question
+    questions = []
+    needed_pages = defaultdict(set)
+    for question in questions_data.get('questions', [])[:20]:
+        meta = question.get('metadata') or {}
+        source_file = question['source'] if 'source' in question else meta.get('source', '')
+        page_num = question['page'] if 'page' in question else meta.get('page', 0)
+        questions.append((question, meta, source_file, page_num))
+        # Only the pages shown for these questions are extracted
+        needed_pages[source_file].add(page_num)
     
     # Load PDF content for comparison
     pdf_content_cache = {}
     pdf_dir = Path(pdf_dir)
+    cache_dir = Path(cache_dir)
     
     for pdf_file in pdf_dir.glob("Questions_*.pdf"):
+        page_numbers = needed_pages.get(pdf_file.name)
+        if not page_numbers:
+            continue
         try:
-            with pdfplumber.open(pdf_file) as pdf:
-                pdf_content_cache[pdf_file.name] = {}
-                for page_num, page in enumerate(pdf.pages, 1):
-                    text = page.extract_text(layout=True) or page.extract_text()
-                    if text:
-                        pdf_content_cache[pdf_file.name][page_num] = text
+            pdf_content_cache[pdf_file.name] = _cached_page_text(pdf_file, page_numbers, cache_dir)
         except Exception as e:
             print(f"Error loading {pdf_file.name}: {e}")
     
-    # Generate navigation and content
-    questions = questions_data.get('questions', [])
-    
-    for i, question in enumerate(questions[:20]):  # Limit to first 20 for performance
-        question_id = question.get('id', f'Q{i}')
-        source_file = question.get('source', question.get('metadata', {}).get('source', ''))
-        page_num = question.get('page', question.get('metadata', {}).get('page', 0))
+    # Classify every question in one pass; the navigation panel comes first in
+    # the page, so comparison blocks are kept as format fields and rendered after it
+    nav_parts = []
+    block_fields = []
+    for i, (question, meta, source_file, page_num) in enumerate(questions):
+        question_id = _escape(question.get('id', f'Q{i}'))
+        description = question.get('description', '')
+        extracted_options = question.get('options', {})
         
         # Determine issue severity for navigation
-        description = question.get('description', '')
-        has_community_pollution = any(term in description.lower() for term in 
-                                    ['upvoted', 'highly voted', 'most recent', 'ago'])
-        has_ocr_errors = any(error in description for error in 
-                           ['ConKgure', 'ReconKgure', 'traOc', 'solu"on'])
+        has_community_pollution = _RE_COMMUNITY_TERMS.search(description) is not None
+        has_ocr_errors = _RE_OCR_ERRORS.search(description) is not None
         
         if has_community_pollution:
             nav_class = 'critical'
-        elif has_ocr_errors or len(question.get('options', {})) < 4:
+        elif has_ocr_errors or len(extracted_options) < 4:
             nav_class = 'major'
         else:
             nav_class = 'good'
         
-        html_content += f'        <a href="#{question_id}" class="nav-item {nav_class}">{question_id} - Page {page_num}</a>\n'
-    
-    html_content += """    </div>
-
-"""
-    
-    # Generate comparison content
-    for i, question in enumerate(questions[:20]):  # Limit to first 20
-        question_id = question.get('id', f'Q{i}')
-        source_file = question.get('source', question.get('metadata', {}).get('source', ''))
-        page_num = question.get('page', question.get('metadata', {}).get('page', 0))
+        page_label = _escape(page_num)
+        nav_parts.append(f'        <a href="#{question_id}" class="nav-item {nav_class}">{question_id} - Page {page_label}</a>\n')
         
         # Get PDF content
         pdf_text = ""
@@ -241,17 +245,23 @@ def create_html_comparison(questions_data: Dict, pdf_dir: str = "./data/input")
         
         # Get extracted content
         extracted_description = question.get('description', 'No description')
-        extracted_options = question.get('options', {})
+        
+        # Page text the extraction reproduced verbatim isn't repeated
+        if pdf_text and extracted_description.startswith(pdf_text):
+            pdf_display = '(matches extracted)'
+        elif pdf_text:
+            pdf_display = _escape(pdf_text)
+        else:
+            pdf_display = 'PDF content not available'
         
         # Identify issues
         issues = []
-        description = question.get('description', '')
-        
-        if 'upvoted' in description.lower():
+        community_terms = {term.lower() for term in _RE_COMMUNITY_ISSUE_TERMS.findall(description)}
+        if 'upvoted' in community_terms:
             issues.append(("CRITICAL", "Community comment 'upvoted' found in question text"))
-        if 'highly voted' in description.lower():
+        if 'highly voted' in community_terms:
             issues.append(("CRITICAL", "Community comment 'Highly Voted' found in question text"))
-        if any(error in description for error in ['ConKgure', 'ReconKgure', 'traOc']):
+        if _RE_OCR_ISSUE_ERRORS.search(description):
             issues.append(("MAJOR", "OCR errors detected in question text"))
         if len(extracted_options) < 4:
             issues.append(("MAJOR", f"Only {len(extracted_options)} answer options found (expected 4-6)"))
@@ -259,53 +269,52 @@ def create_html_comparison(questions_data: Dict, pdf_dir: str = "./data/input")
             issues.append(("CRITICAL", "Question description too short - possible truncation"))
         
         # Format options for display
-        options_text = ""
-        for letter, text in extracted_options.items():
-            options_text += f"{letter}. {text}\n"
-        
-        html_content += f"""    <div class="comparison-container" id="{question_id}">
-        <div class="pdf-section">
-            <div class="section-title pdf-title">📄 Original PDF Content</div>
-            <div class="question-meta">Source: {source_file} | Page: {page_num}</div>
-            <div class="content">{pdf_text[:2000] if pdf_text else 'PDF content not available'}</div>
-        </div>
+        options_text = "".join(f"{_escape(letter)}. {_escape(text)}\n" for letter, text in extracted_options.items())
         
-        <div class="extracted-section">
-            <div class="section-title extracted-title">🔄 Extracted Data</div>
-            <div class="question-meta">Question ID: {question_id} | Confidence: {question.get('confidence', question.get('metadata', {}).get('confidence', 0)):.1%}</div>
-            
-            <div style="margin-bottom: 15px;">
-                <strong>Question:</strong>
-                <div class="content" style="max-height: 200px;">{extracted_description}</div>
-            </div>
-            
-            <div>
-                <strong>Options:</strong>
-                <div class="content" style="max-height: 200px;">{options_text if options_text else 'No options extracted'}</div>
-            </div>
-            
-            {f'''
+        if issues:
+            issue_lines = "\n".join(_ISSUE_LINE.format(severity_class=severity.lower(), severity=severity, message=message)
+                                    for severity, message in issues)
+            issues_panel = f'''
             <div class="issues-panel">
                 <strong>🚨 Issues Detected:</strong>
-                {chr(10).join([f'<div class="issue-{issue[0].lower()}">{issue[0]}: {issue[1]}</div>' for issue in issues])}
+                {issue_lines}
             </div>
-            ''' if issues else ''}
-        </div>
-    </div>
-    
-"""
-    
-    html_content += """    <div style="text-align: center; margin-top: 40px; padding: 20px; background: white; border-radius: 10px;">
-        <h3>📊 Summary</h3>
-        <p>This comparison shows the first 20 questions for detailed analysis.</p>
-        <p>Use the navigation panel to jump to specific questions.</p>
-        <p><strong>Color Coding:</strong> 🔴 Critical Issues | 🟡 Major Issues | 🟢 Good Quality</p>
-    </div>
+            '''
+        else:
+            issues_panel = ''
+        
+        block_fields.append(dict(
+            clean=nav_class == 'good' and not issues,
+            question_id=question_id,
+            source_file=_escape(source_file),
+            page_num=page_label,
+            pdf_text=pdf_display,
+            confidence=question['confidence'] if 'confidence' in question else meta.get('confidence', 0),
+            extracted_description=_escape(extracted_description),
+            options_text=options_text if options_text else 'No options extracted',
+            issues_panel=issues_panel,
+        ))
     
-</body>
-</html>"""
+    out.write(''.join(nav_parts))
+    out.write("""    </div>
+
+""")
+    for fields in block_fields:
+        if fields.pop('clean'):
+            out.write(_CLEAN_BLOCK_OPEN.format(**fields))
+            out.write(_COMPARISON_BLOCK.format(anchor='', **fields))
+            out.write(_CLEAN_BLOCK_CLOSE)
+        else:
+            out.write(_COMPARISON_BLOCK.format(anchor=f' id="{fields["question_id"]}"', **fields))
     
-    return html_content
+    out.write(_HTML_FOOTER)
+
+def install_stylesheet(output_dir: Path) -> None:
+    """Copy the report stylesheet into output_dir unless an identical copy is already there"""
+    target = output_dir / _STYLESHEET.name
+    stylesheet = _STYLESHEET.read_bytes()
+    if not target.exists() or target.read_bytes() != stylesheet:
+        shutil.copyfile(_STYLESHEET, target)
 
 def main():
     """Generate visual comparison HTML"""
@@ -324,17 +333,17 @@ def main():
             questions_data = json.load(f)
         
         print("📄 Generating HTML comparison...")
-        html_content = create_html_comparison(questions_data)
         
-        # Save HTML file
+        # Stream the HTML straight into the output file
         output_dir = Path("./data/output")
         output_dir.mkdir(parents=True, exist_ok=True)
+        install_stylesheet(output_dir)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         html_file = output_dir / f"visual_comparison_{timestamp}.html"
         
         with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            write_html_comparison(questions_data, f)
         
         print(f"✅ Visual comparison generated: {html_file}")
         print(f"🌐 Open in browser: file://{html_file.absolute()}")
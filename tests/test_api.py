@@ -0,0 +1,101 @@
+"""
+API server tests for the question editing endpoints
+Runs the real handler on an ephemeral port against a temporary questions file
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+import http.client
+from http.server import ThreadingHTTPServer
+
+# Add web_ui to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'web_ui'))
+
+import api
+
+class TestQuestionAPI(unittest.TestCase):
+    
+    def setUp(self):
+        """Serve a temporary questions file with a short flush interval"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.questions_path = os.path.join(self.temp_dir.name, 'questions_web_data.json')
+        self.mirror_path = os.path.join(self.temp_dir.name, 'clean_questions_web_data.json')
+        questions = {'questions': [{
+            'id': 'Q1_1',
+            'number': '1',
+            'description': "Original description",
+            'options': {'A': "Option A", 'B': "Option B"},
+            'metadata': {'page': 1},
+        }]}
+        for path in (self.questions_path, self.mirror_path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(questions, f, indent=2)
+        
+        self.original_store = api.STORE
+        self.original_interval = api.FLUSH_INTERVAL
+        api.STORE = api.QuestionStore(self.questions_path, self.mirror_path)
+        api.FLUSH_INTERVAL = 0.05
+        
+        self.server = ThreadingHTTPServer(('localhost', 0), api.QuestionAPIHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        api.STORE = self.original_store
+        api.FLUSH_INTERVAL = self.original_interval
+        self.temp_dir.cleanup()
+    
+    def _request(self, method, path, body=None, headers=None):
+        connection = http.client.HTTPConnection('localhost', self.server.server_address[1], timeout=5)
+        try:
+            connection.request(method, path, body=body, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, dict(response.getheaders()), response.read()
+        finally:
+            connection.close()
+    
+    def test_update_flush_and_conditional_get(self):
+        """Test an update is served, flushed to both files, and revalidates with 304"""
+        update = json.dumps({'id': 'Q1_1', 'description': "Edited description"}).encode('utf-8')
+        status, _, body = self._request('POST', '/api/questions/update', update,
+                                        {'Content-Type': 'application/json'})
+        self.assertEqual(status, 200)
+        self.assertTrue(json.loads(body)['success'])
+        
+        # The edit is served from memory before it reaches disk
+        status, headers, body = self._request('GET', '/api/questions')
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)['questions'][0]['description'], "Edited description")
+        
+        # The background flusher writes the edit to the questions file and the mirror
+        deadline = time.monotonic() + 5
+        while api.STORE.dirty and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertFalse(api.STORE.dirty)
+        for path in (self.questions_path, self.mirror_path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.assertEqual(json.load(f)['questions'][0]['description'], "Edited description")
+        
+        # A client holding the current version gets 304 without a body
+        status, headers, _ = self._request('GET', '/api/questions')
+        etag = headers['ETag']
+        status, headers, body = self._request('GET', '/api/questions', headers={'If-None-Match': etag})
+        self.assertEqual(status, 304)
+        self.assertEqual(headers['ETag'], etag)
+        self.assertEqual(body, b'')
+    
+    def test_update_rejects_large_body(self):
+        """Test updates larger than MAX_BODY_SIZE are refused before reading"""
+        status, _, _ = self._request('POST', '/api/questions/update', b'{}',
+                                     {'Content-Length': str(api.MAX_BODY_SIZE + 1)})
+        self.assertEqual(status, 413)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,16 +6,19 @@ Tests core modules with simple test cases
 import unittest
 import sys
 import os
+import tempfile
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from pdf_processor import PDFProcessor, PageContent
+import question_parser
 from question_parser import QuestionParser, Question
 from text_enhancer import TextEnhancer
 from output_generator import OutputGenerator
 from error_handler import ErrorHandler
+from visual_comparison_tool import create_html_comparison
 
 class TestBasicFunctionality(unittest.TestCase):
     
@@ -79,6 +82,15 @@ class TestBasicFunctionality(unittest.TestCase):
         self.assertNotEqual(test_text, enhanced)
         self.assertLess(enhanced.count('   '), test_text.count('   '))
     
+    def test_text_enhancement_batch(self):
+        """Test batch enhancement matches per-text enhancement"""
+        enhancer = TextEnhancer(self.test_config_path)
+        
+        texts = ["This   is  a   test.", "", "This   is  a   test.", "Another  line"]
+        expected = [enhancer.enhance_extracted_text(text) for text in texts]
+        
+        self.assertEqual(enhancer.enhance_batch(texts), expected)
+    
     def test_question_parsing_basic(self):
         """Test basic question parsing functionality"""
         parser = QuestionParser(self.test_config_path)
@@ -106,6 +118,90 @@ class TestBasicFunctionality(unittest.TestCase):
         self.assertTrue(len(question.options) > 0)
         self.assertEqual(question.community_answer, "C")
     
+    def test_community_answer_ignores_lowercase_article(self):
+        """Test the article "a" after a vote trigger is not taken as answer A"""
+        parser = QuestionParser(self.test_config_path)
+        
+        community_data = parser._parse_community_responses(
+            "I think the correct answer is a bit unclear, B\n"
+            "Highly Voted a lot of people chose D"
+        )
+        
+        self.assertEqual(community_data['community_answer'], "B")
+        self.assertEqual(community_data['highly_voted'], "D")
+    
+    def test_community_indicators_match_unicode_whitespace(self):
+        """Test the fused community pattern treats NBSP the same with and without RE2"""
+        lines = [
+            "johndoe\u00a03\u00a0months ago",
+            "Highly\u00a0Voted",
+            "upvoted\u00a012 times",
+            "The VM\u00a0uses a regional disk",
+        ]
+        expected = [True, True, True, False]
+        
+        engines = [question_parser._compile_community_master(
+            question_parser._COMMUNITY_INDICATOR_PATTERNS, use_re2=False)]
+        if question_parser.re2 is not None:
+            engines.append(question_parser._compile_community_master(
+                question_parser._COMMUNITY_INDICATOR_PATTERNS))
+        
+        for engine in engines:
+            self.assertEqual([bool(engine.search(line)) for line in lines], expected)
+    
+    def test_question_parsing_literal_backslash_n(self):
+        """Test a literal backslash-N in a path does not shift line classification"""
+        parser = QuestionParser(self.test_config_path)
+        
+        sample_question = (
+            "Question #7 Topic 1\n"
+            "Application logs are written to C:\\Network\\logs on every server.\n"
+            "mlantonis 2 months ago\n"
+            "Which service should collect these logs centrally?\n"
+            "A. Cloud Logging agent\n"
+            "B. Cloud Storage FUSE\n"
+        )
+        
+        question = parser.parse_question_structure(sample_question, 1, "test.pdf")
+        
+        self.assertIsNotNone(question)
+        self.assertIn("C:\\Network", question.description)
+        self.assertIn("Which service should collect these logs centrally?", question.description)
+        self.assertNotIn("mlantonis", question.description)
+    
+    def test_option_keeps_literal_backslash_n_path(self):
+        """Test options split only on real newlines, keeping paths like C:\\newdata intact"""
+        parser = QuestionParser(self.test_config_path)
+        
+        sample_question = (
+            "Question #8 Topic 1\n"
+            "Where should the exported application logs be stored?\n"
+            "A. Copy the files to C:\\newdata\\logs\n"
+            "B. Upload the files to a Cloud Storage bucket\n"
+        )
+        
+        question = parser.parse_question_structure(sample_question, 1, "test.pdf")
+        
+        self.assertIsNotNone(question)
+        self.assertEqual(question.options['A'], "Copy the files to C:\\newdata\\logs")
+    
+    def test_comparison_report_flags_ocr_errors(self):
+        """Test an OCR-damaged description is flagged major in the comparison report"""
+        questions_data = {'questions': [{
+            'id': 'Q1_1',
+            'description': "Your instance group is failing health checks. Please ReconKgure the VM.",
+            'options': {'A': "Option A", 'B': "Option B", 'C': "Option C", 'D': "Option D"},
+            'source': "Questions_test.pdf",
+            'page': 1,
+        }]}
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report = create_html_comparison(questions_data, pdf_dir=temp_dir,
+                                            cache_dir=os.path.join(temp_dir, 'cache'))
+        
+        self.assertIn('class="nav-item major"', report)
+        self.assertIn("OCR errors detected", report)
+    
     def test_page_content_creation(self):
         """Test PageContent data structure"""
         page = PageContent(
@@ -174,5 +270,18 @@ class TestBasicFunctionality(unittest.TestCase):
         # A well-formed question should have high confidence
         self.assertGreater(confidence, 0.7)
 
+    def test_confidence_score_without_content(self):
+        """Test questions without description or options score zero"""
+        parser = QuestionParser(self.test_config_path)
+
+        question = Question()
+        question.options = {"A": "Option A"}
+        question.community_answer = "A"
+        question.highly_voted_answer = "A"
+        question.original_number = "1"
+        question.topic = "Test Topic"
+
+        self.assertEqual(parser._calculate_confidence(question), 0.0)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
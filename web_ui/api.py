@@ -4,12 +4,155 @@ Simple API server for handling question data updates
 """
 import json
 import os
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import hashlib
+import shutil
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import threading
 import time
+import signal
+from typing import Tuple
+
+try:
+    import orjson  # Optional: serializes the questions data much faster than json
+except ImportError:
+    orjson = None
+
+# Seconds between background flushes of in-memory edits to disk
+FLUSH_INTERVAL = 2.0
+
+# Largest update request body accepted, in bytes
+MAX_BODY_SIZE = 1 << 20
+
+# Response body for every successful update, encoded once
+UPDATE_OK_BODY = json.dumps({
+    'success': True, 
+    'message': 'Question updated successfully'
+}).encode('utf-8')
+
+class QuestionStore:
+    """
+    Questions JSON held in memory between requests
+    
+    Edits are applied to the parsed data and written to disk by a background
+    flusher (and on shutdown) instead of on every request. While there are no
+    pending edits, a file changed on disk is reloaded on next access.
+    """
+    
+    def __init__(self, path='questions_web_data.json',
+                 mirror_path='../data/output/clean_questions_web_data.json'):
+        self.path = path
+        self.mirror_path = mirror_path
+        self.lock = threading.RLock()
+        self.dirty = False
+        self._body = None
+        self._etag = None
+        self._data = None
+        self._index = None
+        self._mtime_ns = None
+        self._flusher = None
+    
+    def _refresh(self):
+        """Drop cached content if the file changed on disk; raises FileNotFoundError"""
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        if mtime_ns != self._mtime_ns:
+            self._body = self._etag = self._data = self._index = None
+            self._mtime_ns = mtime_ns
+    
+    def response(self) -> Tuple[bytes, str]:
+        """Current questions JSON as UTF-8 bytes, with an ETag for that version"""
+        with self.lock:
+            if not self.dirty:
+                self._refresh()
+            if self._body is None:
+                if self.dirty:
+                    self._body = self._serialize()
+                else:
+                    # Serve the file as stored until there are edits
+                    with open(self.path, 'rb') as f:
+                        self._body = f.read()
+            if self._etag is None:
+                self._etag = '"' + hashlib.blake2b(self._body, digest_size=16).hexdigest() + '"'
+            return self._body, self._etag
+    
+    def data(self) -> dict:
+        """Parsed questions data; callers mutating it hold the lock and call mark_dirty()"""
+        with self.lock:
+            if not self.dirty:
+                self._refresh()
+            if self._data is None:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+            return self._data
+    
+    def find_question(self, question_id):
+        """Return the first question with this id, or None"""
+        with self.lock:
+            data = self.data()
+            if self._index is None:
+                # Built once per load; edits never change ids
+                self._index = {}
+                for question in data.get('questions', []):
+                    self._index.setdefault(question.get('id'), question)
+            return self._index.get(question_id)
+    
+    def mark_dirty(self):
+        """Record an in-memory edit and make sure the flusher is running"""
+        with self.lock:
+            self.dirty = True
+            self._body = self._etag = None
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+                self._flusher.start()
+    
+    def _serialize(self) -> bytes:
+        if orjson is not None:
+            try:
+                # Same two-space layout as json.dumps(indent=2, ensure_ascii=False), encoded
+                # in C. Not byte-identical: some numbers are spelled differently (1e16
+                # where json writes 1e+16), so file bytes depend on whether orjson is installed
+                return orjson.dumps(self._data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                # e.g. integers beyond 64 bits, which the json module still handles
+                pass
+        return json.dumps(self._data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def flush(self):
+        """Write pending edits to the questions file and, if present, the main data file"""
+        with self.lock:
+            if not self.dirty:
+                return
+            body = self._serialize()
+            
+            # Replace atomically so readers never see a half-written file
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(body)
+            os.replace(temp_path, self.path)
+            
+            # Also update the main data file; a file-level copy (sendfile on Linux)
+            # avoids pushing the serialized bytes through Python a second time
+            if os.path.exists(self.mirror_path):
+                shutil.copyfile(self.path, self.mirror_path)
+            
+            self._body = body
+            self._etag = None
+            self._mtime_ns = os.stat(self.path).st_mtime_ns
+            self.dirty = False
+    
+    def _flush_periodically(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Failed to save questions: {e}")
+
+STORE = QuestionStore()
 
 class QuestionAPIHandler(BaseHTTPRequestHandler):
+    # Keep connections alive between requests; every response sends Content-Length
+    protocol_version = "HTTP/1.1"
     
     def do_GET(self):
         """Handle GET requests"""
@@ -29,6 +172,7 @@ class QuestionAPIHandler(BaseHTTPRequestHandler):
         """Handle CORS preflight"""
         self.send_response(200)
         self.send_cors_headers()
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def send_cors_headers(self):
@@ -40,77 +184,100 @@ class QuestionAPIHandler(BaseHTTPRequestHandler):
     def serve_questions(self):
         """Serve the questions JSON file"""
         try:
-            with open('questions_web_data.json', 'r', encoding='utf-8') as f:
-                data = f.read()
+            body, etag = STORE.response()
+            
+            # The client's copy is current: answer without a body
+            if self._etag_matches(etag):
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_cors_headers()
+                self.end_headers()
+                return
             
             self.send_response(200)
             self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
             self.send_cors_headers()
             self.end_headers()
-            self.wfile.write(data.encode('utf-8'))
+            self.wfile.write(body)
             
         except FileNotFoundError:
             self.send_error(404, "Questions data file not found")
         except Exception as e:
             self.send_error(500, f"Server error: {str(e)}")
     
+    def _etag_matches(self, etag: str) -> bool:
+        """Check the request's If-None-Match header against etag"""
+        if_none_match = self.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+        tags = {tag.strip() for tag in if_none_match.split(',')}
+        return '*' in tags or etag in tags or 'W/' + etag in tags
+    
     def update_question(self):
         """Update a question in the JSON file"""
         try:
-            # Read the request data
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            update_data = json.loads(post_data.decode('utf-8'))
-            
-            # Load existing data
-            with open('questions_web_data.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Find and update the question
-            question_id = update_data.get('id')
-            if not question_id:
-                self.send_error(400, "Missing question ID")
+            # Read the request data, refusing bodies too large to be a question update
+            if self.headers['Content-Length'] is None:
+                self.send_error(411, "Content-Length required")
                 return
-            
-            updated = False
-            for i, question in enumerate(data.get('questions', [])):
-                if question.get('id') == question_id:
-                    # Update question fields
-                    if 'number' in update_data:
-                        question['number'] = update_data['number']
-                    if 'description' in update_data:
-                        question['description'] = update_data['description']
-                    if 'options' in update_data:
-                        question['options'] = update_data['options']
-                    if 'metadata' in update_data:
-                        question['metadata'].update(update_data['metadata'])
-                    
-                    updated = True
-                    break
-            
-            if not updated:
-                self.send_error(404, "Question not found")
+            try:
+                content_length = int(self.headers['Content-Length'])
+            except ValueError:
+                content_length = -1
+            if content_length < 0:
+                self.send_error(400, "Invalid Content-Length")
                 return
+            if content_length > MAX_BODY_SIZE:
+                self.send_error(413, "Request body too large")
+                return
+            post_data = self.rfile.read(content_length)
+            # Both parsers take the UTF-8 bytes directly
+            update_data = orjson.loads(post_data) if orjson is not None else json.loads(post_data)
             
-            # Save updated data
-            with open('questions_web_data.json', 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            # Also update the main data file
-            main_data_path = '../data/output/clean_questions_web_data.json'
-            if os.path.exists(main_data_path):
-                with open(main_data_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+            with STORE.lock:
+                # Load existing data
+                STORE.data()
+                
+                # Find and update the question
+                question_id = update_data.get('id')
+                if not question_id:
+                    self.send_error(400, "Missing question ID")
+                    return
+                
+                question = STORE.find_question(question_id)
+                if question is None:
+                    self.send_error(404, "Question not found")
+                    return
+                
+                # Resolve the metadata update first so a bad request leaves the question untouched
+                if 'metadata' in update_data:
+                    metadata = question['metadata']
+                    metadata_update = dict(update_data['metadata'])
+                
+                # Update question fields
+                if 'number' in update_data:
+                    question['number'] = update_data['number']
+                if 'description' in update_data:
+                    question['description'] = update_data['description']
+                if 'options' in update_data:
+                    question['options'] = update_data['options']
+                if 'metadata' in update_data:
+                    metadata.update(metadata_update)
+                
+                # Saved to disk by the background flusher
+                STORE.mark_dirty()
             
             # Send success response
             self.send_response(200)
             self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(UPDATE_OK_BODY)))
             self.send_cors_headers()
             self.end_headers()
-            self.wfile.write(json.dumps({
-                'success': True, 
-                'message': 'Question updated successfully'
-            }).encode('utf-8'))
+            self.wfile.write(UPDATE_OK_BODY)
             
         except json.JSONDecodeError:
             self.send_error(400, "Invalid JSON data")
@@ -123,17 +290,29 @@ class QuestionAPIHandler(BaseHTTPRequestHandler):
 
 def start_api_server(port=9002):
     """Start the API server"""
-    server = HTTPServer(('localhost', port), QuestionAPIHandler)
+    # One thread per connection, so a slow client doesn't hold up the others
+    server = ThreadingHTTPServer(('localhost', port), QuestionAPIHandler)
     print(f"🚀 Question API server starting on http://localhost:{port}")
     print("📝 Available endpoints:")
     print("  GET  /api/questions - Get all questions")
     print("  POST /api/questions/update - Update a question")
     
+    # Stop through the KeyboardInterrupt path on SIGTERM too, so pending edits are saved
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\\n🛑 Server stopped")
         server.shutdown()
+    finally:
+        try:
+            STORE.flush()
+        except Exception as e:
+            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Failed to save questions: {e}")
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
 
 if __name__ == '__main__':
     # Change to web_ui directory